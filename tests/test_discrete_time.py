@@ -0,0 +1,72 @@
+# Copyright 2025 Takayoshi Matsuyama
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""離散時間のテスト (Tests for the discrete time)"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tkmotion.prof.motion_profile import MotionProfileLoader
+from tkmotion.time.discrete_time import DiscreteTime
+
+# リポジトリ直下のパス (path of the repository root)
+ROOT = Path(__file__).resolve().parents[1]
+PROF_CONFIG = str(ROOT / "tkmotion/prof/default_motion_prof_config.json")
+
+
+def _dtime(time_step_us: float, duration_s: float) -> DiscreteTime:
+    return DiscreteTime(
+        {"version": "0.3.0", "time_step_us": time_step_us, "duration_s": duration_s}
+    )
+
+
+def test_time_array_has_no_drift():
+    dtime = _dtime(100, 6.0)
+    t = dtime.get_time_array()
+
+    assert t.shape == (60001,)
+    assert t[0] == 0.0
+    assert t[-1] == pytest.approx(6.0, abs=1e-12)
+    np.testing.assert_allclose(t, np.arange(60001) * 1e-4, rtol=0.0, atol=1e-12)
+    assert list(dtime.get_time_step_generator()) == t.tolist()
+
+    # 遅延1.0秒のステップはちょうど1.0秒のサンプルで始まる
+    # (a step delayed by 1.0 s starts exactly at the 1.0 s sample)
+    step = MotionProfileLoader().load(PROF_CONFIG, 3)
+    vel, _ = step.calculate_cmd_vel_pos_array(t)
+    assert np.flatnonzero(vel)[0] == 10000
+
+
+@pytest.mark.parametrize(
+    "time_step_us, duration_s, expected",
+    [
+        (350000, 1.0, [0.0, 0.35, 0.7]),
+        (300000, 1.0, [0.0, 0.3, 0.6, 0.9]),
+        (400000, 1.0, [0.0, 0.4, 0.8]),
+    ],
+)
+def test_time_array_does_not_exceed_duration(time_step_us, duration_s, expected):
+    # durationがdtの整数倍でない場合も、duration以下の時刻のみを返す
+    # (only times not exceeding duration are returned even if duration is not
+    #  a multiple of dt)
+    dtime = _dtime(time_step_us, duration_s)
+    t = dtime.get_time_array()
+
+    np.testing.assert_allclose(t, expected, rtol=0.0, atol=1e-12)
+    assert t[-1] <= duration_s
+    assert list(dtime.get_time_step_generator()) == t.tolist()
@@ -0,0 +1,76 @@
+# Copyright 2025 Takayoshi Matsuyama
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""モーションフローのテスト (Tests for the motion flow)"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from tkmotion.ctrl.controller import ControllerLoader
+from tkmotion.flow.motion_flow import MotionFlow
+
+# リポジトリ直下のパス (path of the repository root)
+ROOT = Path(__file__).resolve().parents[1]
+TIME_CONFIG = str(ROOT / "tkmotion/time/default_discrete_time_config.json")
+PROF_CONFIG = str(ROOT / "tkmotion/prof/default_motion_prof_config.json")
+CTRL_CONFIG = str(ROOT / "tkmotion/ctrl/default_controller_config.json")
+PLANT_CONFIG = str(ROOT / "tkmotion/plant/default_plant_config.json")
+
+# PIDコントローラ設定のインデックス (index of the PID controller configuration)
+PID_INDEX = 1
+
+
+def _make_flow(prof_index: int, plant_index: int) -> MotionFlow:
+    flow = MotionFlow()
+    flow.load_discrete_time(TIME_CONFIG)
+    flow.load_motion_profile(PROF_CONFIG, prof_index)
+    flow.load_controller(CTRL_CONFIG, PID_INDEX)
+    flow.load_plant(PLANT_CONFIG, plant_index)
+    return flow
+
+
+@pytest.mark.parametrize(
+    "prof_index, plant_index",
+    [
+        (2, 0),  # インパルス, 質点 (impulse, mass point)
+        (2, 1),  # インパルス, 質量・減衰器・ばね (impulse, mass-damper-spring)
+        (1, 1),  # 台形, 質量・減衰器・ばね (trapezoid, mass-damper-spring)
+        (6, 1),  # 正弦波, 質量・減衰器・ばね (sine, mass-damper-spring)
+    ],
+)
+def test_execute_sweep_runs_are_independent(prof_index, plant_index):
+    flow = _make_flow(prof_index, plant_index)
+    controller = ControllerLoader().load(CTRL_CONFIG, PID_INDEX)
+
+    first, second = flow.execute_sweep([controller, controller])
+
+    # 同じコントローラの試行は、先に実行した試行の影響を受けない
+    # (runs of the same controller are not affected by earlier runs)
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(first, _make_flow(prof_index, plant_index).execute())
+
+
+def test_execute_arrow_matches_execute():
+    pa = pytest.importorskip("pyarrow")
+
+    table = _make_flow(1, 1).execute_arrow()
+    frame = _make_flow(1, 1).execute()
+
+    assert isinstance(table, pa.Table)
+    assert table.column_names == list(frame.columns)
+    pd.testing.assert_frame_equal(table.to_pandas(), frame)
@@ -0,0 +1,211 @@
+# Copyright 2025 Takayoshi Matsuyama
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""モーションプロファイルのテスト (Tests for the motion profiles)"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tkmotion.prof.motion_profile import MotionProfileLoadError
+from tkmotion.prof.motion_profile import MotionProfileLoader
+from tkmotion.prof.motion_profile import TrapezoidalMotionProfile
+
+# リポジトリ直下のパス (path of the repository root)
+ROOT = Path(__file__).resolve().parents[1]
+PROF_CONFIG = str(ROOT / "tkmotion/prof/default_motion_prof_config.json")
+
+# 既定のモーションプロファイル設定の数 (number of default motion profile configurations)
+NUM_DEFAULT_PROFILES = 7
+
+
+def _trap(v: float, a: float, length: float) -> TrapezoidalMotionProfile:
+    return TrapezoidalMotionProfile(
+        {
+            "version": "0.3.0",
+            "type": "trapezoid",
+            "max_velocity_m_s": v,
+            "acceleration_m_s2": a,
+            "length_m": length,
+        }
+    )
+
+
+def _scalar_path(profile, t: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    vel, pos = zip(*(profile.calculate_cmd_vel_pos(x) for x in t.tolist()))
+    return np.array(vel, dtype=np.float64), np.array(pos, dtype=np.float64)
+
+
+@pytest.mark.parametrize(
+    "v, a, length",
+    [
+        (0.01, 0.005, 0.03),  # 台形 (trapezoid)
+        (2.0, 1.0, 10.0),  # 台形 (trapezoid)
+        (0.5, 0.5, -3.0),  # 台形, 負方向 (trapezoid, negative direction)
+        (2.0, 1.0, 1.0),  # 三角形 (triangle)
+        (1.0, 2.0, -0.1),  # 三角形, 負方向 (triangle, negative direction)
+    ],
+)
+def test_trapezoid_array_matches_scalar(v, a, length):
+    p = _trap(v, a, length)
+    t = np.linspace(-0.5, p.T + 1.0, 20001)
+    t = np.concatenate([t, [p.Ta, p.Ta + p.Tc, p.T]])
+
+    # 特殊化したスカラー計算と区間表による配列計算が一致する
+    # (the specialized scalar evaluator and the piece-table array path agree)
+    vel_s, pos_s = _scalar_path(p, t)
+    vel_a, pos_a = p.calculate_cmd_vel_pos_array(t)
+
+    np.testing.assert_allclose(vel_a, vel_s, rtol=0.0, atol=1e-12)
+    np.testing.assert_allclose(pos_a, pos_s, rtol=0.0, atol=1e-12)
+
+
+@pytest.mark.parametrize("v, a, length", [(2.0, 1.0, 10.0), (2.0, 1.0, 1.0)])
+def test_trapezoid_reaches_length_without_jump(v, a, length):
+    p = _trap(v, a, length)
+
+    # 移動時間Tで移動距離に到達し、停止区間へ連続につながる
+    # (reaches the moving length at T and continues smoothly into the stop phase)
+    vel_end, pos_end = p.calculate_cmd_vel_pos(p.T)
+    _, pos_stop = p.calculate_cmd_vel_pos(p.T + 1e-9)
+    assert vel_end == pytest.approx(0.0, abs=1e-12)
+    assert pos_end == pytest.approx(length, abs=1e-12)
+    assert pos_stop == pytest.approx(length, abs=1e-12)
+
+    # 位置は単調で、隣接サンプル間の変化は最大速度で制限される
+    # (position is monotonic and changes no faster than the maximum velocity)
+    t = np.linspace(0.0, p.T + 0.5, 10001)
+    _, pos = p.calculate_cmd_vel_pos_array(t)
+    step = np.diff(pos)
+    assert np.all(step >= -1e-15)
+    assert np.max(step) <= v * (t[1] - t[0]) + 1e-12
+
+
+@pytest.mark.parametrize("prof_index", range(NUM_DEFAULT_PROFILES))
+def test_default_profiles_array_matches_scalar(prof_index):
+    # 状態を持つプロファイル (インパルス) のため、それぞれ新しく読み込む
+    # (load fresh profiles for each path, since the impulse profile is stateful)
+    p_array = MotionProfileLoader().load(PROF_CONFIG, prof_index)
+    p_scalar = MotionProfileLoader().load(PROF_CONFIG, prof_index)
+    t = np.arange(0.0, 3.0, 1e-3)
+
+    # 分割して計算しても、時刻順のスカラー計算と一致する
+    # (evaluating in chunks still matches the scalar path in time order)
+    parts = [p_array.calculate_cmd_vel_pos_array(c) for c in np.array_split(t, 5)]
+    vel_a = np.concatenate([v for v, _ in parts])
+    pos_a = np.concatenate([p for _, p in parts])
+    vel_s, pos_s = _scalar_path(p_scalar, t)
+
+    np.testing.assert_allclose(vel_a, vel_s, rtol=0.0, atol=1e-12)
+    np.testing.assert_allclose(pos_a, pos_s, rtol=0.0, atol=1e-12)
+
+    # 指令速度と位置は最後の時刻の値となる (command values hold the last sample)
+    assert p_array.cmd_vel == p_scalar.cmd_vel
+    assert p_array.cmd_pos == p_scalar.cmd_pos
+
+
+@pytest.mark.parametrize(
+    "profile, cause",
+    [
+        # 互換性のないバージョン (incompatible version)
+        ({"version": "1.0.0", "type": "default"}, "ConfigVersionIncompatibleError"),
+        # 必須キーなし (missing required keys)
+        ({"version": "0.3.0", "type": "trapezoid"}, "KeyError"),
+        # 速度がゼロ (zero velocity)
+        (
+            {
+                "version": "0.3.0",
+                "type": "trapezoid",
+                "max_velocity_m_s": 0.0,
+                "acceleration_m_s2": 1.0,
+                "length_m": 1.0,
+            },
+            "VelocityZeroOrMinusError",
+        ),
+        # 設定が辞書でない (configuration is not a dictionary)
+        (["0.3.0", "trapezoid"], "TypeError"),
+    ],
+)
+def test_loader_raises_load_error(tmp_path, profile, cause):
+    filepath = tmp_path / "prof.json"
+    filepath.write_text(json.dumps([{"motion_profile": [profile]}]))
+
+    with pytest.raises(MotionProfileLoadError) as excinfo:
+        MotionProfileLoader().load(str(filepath), 0)
+    assert type(excinfo.value.__cause__).__name__ == cause
+
+
+def test_loader_raises_load_error_for_missing_file_or_index(tmp_path):
+    with pytest.raises(MotionProfileLoadError):
+        MotionProfileLoader().load(str(tmp_path / "missing.json"), 0)
+    with pytest.raises(MotionProfileLoadError):
+        MotionProfileLoader().load(PROF_CONFIG, NUM_DEFAULT_PROFILES)
+
+    # ValueErrorの派生クラスとして捕捉できる (can be caught as a ValueError subclass)
+    with pytest.raises(ValueError):
+        MotionProfileLoader().load(PROF_CONFIG, NUM_DEFAULT_PROFILES)
+
+
+@pytest.mark.parametrize("length", [0.03, -0.03])
+def test_trapezoid_sample(length):
+    p = _trap(0.01, 0.005, length)
+
+    # 時間配列は0から、移動時間T以上となる最初の時刻まで
+    # (the time array runs from 0 to the first time not less than T)
+    t, vel, pos = p.sample(0.01)
+    assert t[0] == 0.0
+    assert t[-2] < p.T <= t[-1]
+    np.testing.assert_allclose(np.diff(t), 0.01, rtol=0.0, atol=1e-12)
+    vel_a, pos_a = p.calculate_cmd_vel_pos_array(t)
+    np.testing.assert_array_equal(vel, vel_a)
+    np.testing.assert_array_equal(pos, pos_a)
+    assert pos[-1] == pytest.approx(length, abs=1e-12)
+
+    with pytest.raises(ValueError):
+        p.sample(0.0)
+
+
+def test_trapezoid_sample_n():
+    p = _trap(0.01, 0.005, 0.03)
+
+    t, vel, pos = p.sample_n(101)
+    assert t.shape == vel.shape == pos.shape == (101,)
+    assert t[0] == 0.0
+    assert t[-1] == p.T
+    assert vel[0] == 0.0
+    assert vel[-1] == pytest.approx(0.0, abs=1e-12)
+    assert pos[-1] == pytest.approx(0.03, abs=1e-12)
+
+
+def test_trapezoid_params_are_frozen_contiguous():
+    p = _trap(2.0, 1.0, -10.0)
+    params = p.params
+
+    # (V, A, L, Ta, Tc, T, dir, C1, C2) の順 (ordered as (V, A, L, Ta, Tc, T, dir, C1, C2))
+    np.testing.assert_array_equal(
+        params, [2.0, 1.0, 10.0, p.Ta, p.Tc, p.T, -1.0, 2.0, 2.0 + 2.0 * p.Tc]
+    )
+    assert params.dtype == np.float64
+    assert params.flags.c_contiguous
+    assert not params.flags.writeable
+    with pytest.raises(ValueError):
+        params[0] = 1.0
+
+    # 同じ配列を返し、先頭アドレスも変わらない (the same array and address are returned)
+    assert p.params is params
+    assert p.params_ptr() == params.ctypes.data
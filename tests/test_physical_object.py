@@ -0,0 +1,197 @@
+# Copyright 2025 Takayoshi Matsuyama
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""物理オブジェクトのテスト (Tests for the physical objects)"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from tkmotion.plant.physical_object import MDSPhysicalObject
+from tkmotion.plant.physical_object import PhysicalObject
+from tkmotion.plant.physical_object import PhysicalObjectBatch
+
+PHYOBJ_CONFIG = {"version": "0.3.0", "mass_kg": 2.0}
+MDS_CONFIG = {
+    "version": "0.3.0",
+    "mass_kg": 2.0,
+    "damper_Ns_m": 3.0,
+    "spring_N_m": 80.0,
+    "spring_balance_pos_m": 0.01,
+    "static_friction_coeff": 0.05,
+    "dynamic_friction_coeff": 0.03,
+}
+
+
+def test_observed_data_is_cached_read_only_snapshot():
+    obj = MDSPhysicalObject(dict(MDS_CONFIG))
+    observer = obj.get_observer()
+    for f in (1.0, 2.0, 3.0):
+        obj.apply_force(f, 1e-3)
+        observer.observe()
+
+    # 観測が追加されるまでは同じデータを返す (the same data is returned until observed again)
+    data = observer.get_observed_data()
+    assert observer.get_observed_data() is data
+    assert all(len(values) == 3 for values in data.values())
+
+    # 読み取り専用で、呼び出し側から変更できない (read-only, callers cannot modify it)
+    with pytest.raises(ValueError):
+        data["obj_position_m"][0] = 1.0
+    with pytest.raises(TypeError):
+        data["obj_position_m"] = np.zeros(3)
+
+    # observeでキャッシュが更新され、以前のデータは変化しない
+    # (observe refreshes the cache, and the earlier data does not change)
+    obj.apply_force(4.0, 1e-3)
+    observer.observe()
+    assert len(observer.get_observed_data()["net_force_N"]) == 4
+    assert len(data["net_force_N"]) == 3
+
+    # resetの後も以前のデータは変化しない (the earlier data survives reset)
+    observer.reset()
+    assert len(observer.get_observed_data()["obj_velocity_m_s"]) == 0
+    assert all(len(values) == 3 for values in data.values())
+
+
+@pytest.mark.parametrize("mass", [0.0, -1.0, float("nan")])
+@pytest.mark.parametrize(
+    "cls, config", [(PhysicalObject, PHYOBJ_CONFIG), (MDSPhysicalObject, MDS_CONFIG)]
+)
+def test_non_positive_mass_is_rejected(cls, config, mass):
+    with pytest.raises(ValueError, match="mass must be positive"):
+        cls(dict(config, mass_kg=mass))
+
+    obj = cls(dict(config))
+    with pytest.raises(ValueError, match="mass must be positive"):
+        obj.mass = mass
+    assert obj.mass == 2.0
+
+
+@pytest.mark.parametrize(
+    "cls, config", [(PhysicalObject, PHYOBJ_CONFIG), (MDSPhysicalObject, MDS_CONFIG)]
+)
+def test_apply_force_series_matches_apply_force(cls, config):
+    rng = np.random.default_rng(0)
+    forces = rng.normal(0.0, 5.0, 2000)
+    forces[500:600] = 0.0  # 静止摩擦の区間 (interval for static friction)
+    dt = 1e-3
+
+    obj_loop = cls(dict(config))
+    obj_loop.set_state(0.0, 0.1, -0.02)
+    acc_l, vel_l, pos_l = [], [], []
+    for f in forces.tolist():
+        obj_loop.apply_force(f, dt)
+        acc_l.append(obj_loop.acc)
+        vel_l.append(obj_loop.vel)
+        pos_l.append(obj_loop.pos)
+
+    obj_series = cls(dict(config))
+    obj_series.set_state(0.0, 0.1, -0.02)
+    acc_s, vel_s, pos_s = obj_series.apply_force_series(forces, dt)
+
+    # 同じ演算順序のため、ビット単位で一致する (bit-identical, same operation order)
+    np.testing.assert_array_equal(acc_s, acc_l)
+    np.testing.assert_array_equal(vel_s, vel_l)
+    np.testing.assert_array_equal(pos_s, pos_l)
+    assert obj_series.acc == obj_loop.acc
+    assert obj_series.vel == obj_loop.vel
+    assert obj_series.pos == obj_loop.pos
+
+
+@pytest.mark.parametrize(
+    "cls, config", [(PhysicalObject, PHYOBJ_CONFIG), (MDSPhysicalObject, MDS_CONFIG)]
+)
+def test_pack_state_round_trip(cls, config):
+    src = cls(dict(config))
+    src.set_state(0.0, 0.2, 0.01)
+    for f in (1.0, -2.0, 0.5):
+        src.apply_force(f, 1e-3)
+    buf = src.pack_state()
+    assert len(buf) == cls._STATE_FMT.size
+
+    dst = cls(dict(config))
+    dst.unpack_state(buf)
+    assert dst.pack_state() == buf
+
+    # 復元した状態から同じ結果が得られる (the restored state gives the same results)
+    src.apply_force(3.0, 1e-3)
+    dst.apply_force(3.0, 1e-3)
+    assert dst.pack_state() == src.pack_state()
+
+
+def test_mds_state_does_not_depend_on_observer():
+    observed = MDSPhysicalObject(dict(MDS_CONFIG))
+    observer = observed.get_observer()
+    plain = MDSPhysicalObject(dict(MDS_CONFIG))
+    for f in (1.0, -2.0, 0.5):
+        observed.apply_force(f, 1e-3)
+        observer.observe()
+        plain.apply_force(f, 1e-3)
+
+    # 力の成分は観測者の有無に関わらず保持される
+    # (force components are stored with or without an observer)
+    assert plain.pack_state() == observed.pack_state()
+    assert observer.get_observed_data()["net_force_N"][-1] == plain._net_force
+
+
+def test_batch_matches_single_objects():
+    masses = np.array([0.5, 1.0, 2.0, 4.0])
+    forces = np.array([1.0, -2.0, 0.5, 3.0])
+    dt = 1e-3
+
+    batch = PhysicalObjectBatch(masses)
+    singles = [PhysicalObject(dict(PHYOBJ_CONFIG, mass_kg=m)) for m in masses]
+    for _ in range(1000):
+        batch.apply_force(forces, dt)
+        for obj, f in zip(singles, forces.tolist()):
+            obj.apply_force(f, dt)
+
+    assert len(batch) == 4
+    np.testing.assert_allclose(batch.acc, [o.acc for o in singles], rtol=1e-12)
+    np.testing.assert_allclose(batch.vel, [o.vel for o in singles], rtol=1e-12)
+    np.testing.assert_allclose(batch.pos, [o.pos for o in singles], rtol=1e-12)
+
+    batch.reset()
+    assert not batch.pos.any()
+
+
+@pytest.mark.parametrize("masses", [2.0, [[1.0, 2.0]]])
+def test_batch_rejects_non_1d_masses(masses):
+    with pytest.raises(ValueError, match="1-D"):
+        PhysicalObjectBatch(np.asarray(masses))
+
+
+def test_batch_float32_tracks_float64():
+    masses = np.array([0.5, 1.0, 2.0, 4.0])
+    forces = np.array([1.0, -2.0, 0.5, 3.0])
+    dt = 1e-3
+
+    batch64 = PhysicalObjectBatch(masses)
+    batch32 = PhysicalObjectBatch(masses, dtype=np.float32)
+    for _ in range(1000):
+        batch64.apply_force(forces, dt)
+        batch32.apply_force(forces, dt)
+
+    assert batch32.dtype == np.float32
+    assert batch32.pos.dtype == batch32.vel.dtype == np.float32
+    np.testing.assert_allclose(batch32.vel, batch64.vel, rtol=1e-4)
+    np.testing.assert_allclose(batch32.pos, batch64.pos, rtol=1e-4)
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.bool_, np.complex128])
+def test_batch_rejects_non_floating_dtype(dtype):
+    with pytest.raises(ValueError, match="floating point"):
+        PhysicalObjectBatch(np.array([1.0, 2.0]), dtype=dtype)
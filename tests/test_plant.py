@@ -0,0 +1,57 @@
+# Copyright 2025 Takayoshi Matsuyama
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""プラントのテスト (Tests for the plant)"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from tkmotion.plant.physical_object import MDSPhysicalObject
+from tkmotion.plant.plant import PlantLoader
+
+# リポジトリ直下のパス (path of the repository root)
+ROOT = Path(__file__).resolve().parents[1]
+PLANT_CONFIG = str(ROOT / "tkmotion/plant/default_plant_config.json")
+
+
+def test_loaded_plant_configs_are_independent():
+    plant = PlantLoader().load(PLANT_CONFIG, 1)
+    plant.get_config()["physical_object"][0]["mass_kg"] = 0.0
+
+    # 先に読み込んだプラントの設定変更は、次の読込に影響しない
+    # (changes to an earlier plant's configuration do not affect the next load)
+    reloaded = PlantLoader().load(PLANT_CONFIG, 1)
+    assert isinstance(reloaded.physical_obj, MDSPhysicalObject)
+    assert reloaded.get_config()["physical_object"][0]["mass_kg"] == 2.0
+    assert reloaded.physical_obj.mass == 2.0
+
+
+def test_load_many_keeps_order_and_marks_failures(tmp_path, capsys):
+    missing = str(tmp_path / "missing.json")
+    filepaths = [PLANT_CONFIG, missing, PLANT_CONFIG]
+
+    plants = PlantLoader().load_many(filepaths, plant_index=1, max_workers=2)
+
+    # 結果はfilepathsと同じ順序で、読込に失敗した要素はNoneとなる
+    # (results follow the order of filepaths, and failed loads are None)
+    assert len(plants) == 3
+    assert plants[1] is None
+    for plant in (plants[0], plants[2]):
+        assert isinstance(plant.physical_obj, MDSPhysicalObject)
+        assert plant.get_config() == PlantLoader().load(PLANT_CONFIG, 1).get_config()
+    assert plants[0] is not plants[2]
+    assert "Error loading plant" in capsys.readouterr().out
+
+    assert PlantLoader().load_many([]) == []
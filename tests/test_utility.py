@@ -0,0 +1,78 @@
+# Copyright 2025 Takayoshi Matsuyama
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ユーティリティのテスト (Tests for the utilities)"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from tkmotion.util.utility import Utility
+
+
+def test_load_json_returns_independent_copies(tmp_path):
+    filepath = tmp_path / "config.json"
+    filepath.write_text(json.dumps([{"plant": [{"version": "0.3.0"}]}]))
+
+    # 呼び出し側の変更は、次に読み込んだ結果に影響しない
+    # (changes by a caller do not affect the next load)
+    config = Utility.load_json(str(filepath))
+    config[0]["plant"][0]["version"] = "CORRUPT"
+    assert Utility.load_json(str(filepath))[0]["plant"][0]["version"] == "0.3.0"
+
+
+def test_load_json_rereads_modified_file(tmp_path):
+    filepath = tmp_path / "config.json"
+    filepath.write_text(json.dumps({"value": 1}))
+    assert Utility.load_json(str(filepath)) == {"value": 1}
+
+    # 更新時刻が変わると、ファイルを読み直す (the file is re-read when its mtime changes)
+    filepath.write_text(json.dumps({"value": 2}))
+    mtime_ns = os.stat(filepath).st_mtime_ns + 1_000_000_000
+    os.utime(filepath, ns=(mtime_ns, mtime_ns))
+    assert Utility.load_json(str(filepath)) == {"value": 2}
+
+
+@pytest.mark.parametrize(
+    "module_version, config_version, expected",
+    [
+        ("0.3.0", "0.3.0", True),
+        ("0.4.0", "0.3.1", True),
+        ("1.0.0", "0.3.0", False),
+        ("10.0.0", "1.0.0", False),
+    ],
+)
+def test_is_config_compatible(module_version, config_version, expected):
+    assert Utility.is_config_compatible(module_version, config_version) is expected
+
+
+@pytest.mark.parametrize(
+    "module_version, config_version",
+    [("0.3.0", "0.3"), ("0.3.0", " 0.3.0"), ("0.3.0", "-1.3.0"), ("0.3", "0.3")],
+)
+def test_is_config_compatible_rejects_invalid_format(module_version, config_version):
+    with pytest.raises(ValueError, match="Invalid version format"):
+        Utility.is_config_compatible(module_version, config_version)
+
+
+def test_require_keys_lists_all_missing_keys():
+    Utility.require_keys({"a": 1, "b": 2}, ("a", "b"), "test")
+
+    with pytest.raises(KeyError) as excinfo:
+        Utility.require_keys({"a": 1}, ("a", "b", "c"), "test")
+    assert "['b', 'c']" in str(excinfo.value)
+    assert "test configuration" in str(excinfo.value)
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import numpy as np
-import json
 from tkmotion.util.utility import Utility
 from tkmotion.util.utility import ConfigVersionIncompatibleError
 
@@ -50,32 +49,20 @@ class ControllerLoader:
             Controller: コントローラオブジェクト (controller object)
         """
         try:
-            with open(filepath, "r") as f:
-                config = json.load(f)
-                # 設定バージョン互換性確認 (Check configuration version compatibility)
-                is_compatible = Utility.is_config_compatible(
-                    module_version, config[0]["controller"][ctrl_index]["version"]
+            ctrl_config = Utility.load_json(filepath)[0]["controller"][ctrl_index]
+            # 設定バージョン互換性確認 (Check configuration version compatibility)
+            is_compatible = Utility.is_config_compatible(
+                module_version, ctrl_config["version"]
+            )
+            if not is_compatible:
+                raise ConfigVersionIncompatibleError(
+                    f"Incompatible controller config version: "
+                    f"module_version={module_version}, "
+                    f"config_version={ctrl_config['version']}"
                 )
-                if not is_compatible:
-                    raise ConfigVersionIncompatibleError(
-                        f"Incompatible controller config version: "
-                        f"module_version={module_version}, "
-                        f"config_version={config[0]['controller'][ctrl_index]['version']}"
-                    )
-                # コントローラオブジェクト作成
-                match config[0]["controller"][ctrl_index]["type"]:
-                    case "PID":
-                        return PIDController(config[0]["controller"][ctrl_index])
-                    case "impulse":
-                        return ImpulseController(config[0]["controller"][ctrl_index])
-                    case "step":
-                        return StepController(config[0]["controller"][ctrl_index])
-                    case "sin":
-                        return SinusoidalController(config[0]["controller"][ctrl_index])
-                    case "sinsweep":
-                        return SinSweepController(config[0]["controller"][ctrl_index])
-                    case _:
-                        return Controller(config[0]["controller"][ctrl_index])
+            # コントローラオブジェクト作成
+            controller_cls = _CONTROLLER_TYPES.get(ctrl_config["type"], Controller)
+            return controller_cls(ctrl_config)
         except Exception as e:
             print(f"Error loading controller: {type(e)} {e}")
         return None
@@ -476,6 +463,13 @@ class PIDControllerObserver(ControllerObserver):
 class ImpulseController(Controller):
     """インパルスコントローラクラス (Impulse Controller Class)"""
 
+    # 必須設定キー (required configuration keys)
+    _REQUIRED_KEYS: tuple[str, ...] = (
+        "impulse_force_N",
+        "impulse_on_timestep_count",
+        "delay_s",
+    )
+
     def __init__(self, config: dict) -> None:
         """ImpulseControllerを初期化する (Initializes the ImpulseController)
 
@@ -488,34 +482,16 @@ class ImpulseController(Controller):
         """
         super().__init__(config)
 
+        Utility.require_keys(self._config, self._REQUIRED_KEYS, "controller")
+
         # インパルス推力 (impulse force)
-        try:
-            _p_force: float = self._config["impulse_force_N"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'impulse_force_N' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.p_force: float = _p_force
+        self.p_force: float = self._config["impulse_force_N"]
 
         # インパルスONタイムステップ数 (impulse on time step count)
-        try:
-            _on_timestep_count: int = self._config["impulse_on_timestep_count"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'impulse_on_timestep_count' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.on_timestep_count: int = _on_timestep_count
+        self.on_timestep_count: int = self._config["impulse_on_timestep_count"]
 
         # 遅延時間 (delay time)
-        try:
-            _delay_s: float = self._config["delay_s"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'delay_s' in motion profile " f"configuration: {type(e)} {e}"
-            )
-        self.delay_s: float = _delay_s
+        self.delay_s: float = self._config["delay_s"]
 
         # 時間ステップカウンタ (time step counter)
         self._step_counter: int = 0
@@ -561,6 +537,12 @@ class ImpulseController(Controller):
 class StepController(Controller):
     """ステップコントローラクラス (Step Controller Class)"""
 
+    # 必須設定キー (required configuration keys)
+    _REQUIRED_KEYS: tuple[str, ...] = (
+        "step_force_N",
+        "delay_s",
+    )
+
     def __init__(self, config: dict) -> None:
         """StepControllerを初期化する (Initializes StepController)
 
@@ -573,24 +555,13 @@ class StepController(Controller):
         """
         super().__init__(config)
 
+        Utility.require_keys(self._config, self._REQUIRED_KEYS, "controller")
+
         # ステップ推力 (step force)
-        try:
-            _s_force: float = self._config["step_force_N"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'step_force_N' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.s_force: float = _s_force
+        self.s_force: float = self._config["step_force_N"]
 
         # 遅延時間 (delay time)
-        try:
-            _delay_s: float = self._config["delay_s"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'delay_s' in motion profile " f"configuration: {type(e)} {e}"
-            )
-        self.delay_s: float = _delay_s
+        self.delay_s: float = self._config["delay_s"]
 
     def reset(self) -> None:
         """コントローラの状態をリセットする (Resets the controller state)"""
@@ -630,6 +601,12 @@ class StepController(Controller):
 class SinusoidalController(Controller):
     """正弦波コントローラクラス (Sinusoidal Controller Class)"""
 
+    # 必須設定キー (required configuration keys)
+    _REQUIRED_KEYS: tuple[str, ...] = (
+        "amplitude_N",
+        "frequency_Hz",
+    )
+
     def __init__(self, config: dict) -> None:
         """SinusoidalControllerを初期化する (Initializes SinusoidalController)
 
@@ -642,25 +619,13 @@ class SinusoidalController(Controller):
         """
         super().__init__(config)
 
+        Utility.require_keys(self._config, self._REQUIRED_KEYS, "controller")
+
         # サイン波振幅 (sinusoidal amplitude)
-        try:
-            _amplitude: float = self._config["amplitude_N"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'amplitude_N' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.amplitude: float = _amplitude
+        self.amplitude: float = self._config["amplitude_N"]
 
         # サイン波周波数 (sinusoidal frequency)
-        try:
-            _frequency: float = self._config["frequency_Hz"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'frequency_Hz' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.frequency: float = _frequency
+        self.frequency: float = self._config["frequency_Hz"]
 
     def reset(self) -> None:
         """コントローラの状態をリセットする (Resets the controller state)"""
@@ -694,6 +659,14 @@ class SinusoidalController(Controller):
 class SinSweepController(Controller):
     """正弦波掃引コントローラクラス (Sinusoidal Sweep Controller Class)"""
 
+    # 必須設定キー (required configuration keys)
+    _REQUIRED_KEYS: tuple[str, ...] = (
+        "start_frequency_Hz",
+        "end_frequency_Hz",
+        "duration_s",
+        "amplitude_N",
+    )
+
     def __init__(self, config: dict) -> None:
         """SinusoidalSweepControllerを初期化する (Initializes SinusoidalSweepController)
 
@@ -706,41 +679,19 @@ class SinSweepController(Controller):
         """
         super().__init__(config)
 
+        Utility.require_keys(self._config, self._REQUIRED_KEYS, "controller")
+
         # スイープ開始周波数 (sweep start frequency)
-        try:
-            self._f_start: float = self._config["start_frequency_Hz"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'start_frequency_Hz' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
+        self._f_start: float = self._config["start_frequency_Hz"]
 
         # スイープ終了周波数 (sweep end frequency)
-        try:
-            self._f_end: float = self._config["end_frequency_Hz"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'end_frequency_Hz' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
+        self._f_end: float = self._config["end_frequency_Hz"]
 
         # スイープ継続時間 (sweep duration)
-        try:
-            self._T: float = self._config["duration_s"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'duration_s' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
+        self._T: float = self._config["duration_s"]
 
         # サイン波振幅 (sinusoidal amplitude)
-        try:
-            self._amp: float = self._config["amplitude_N"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'amplitude_N' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
+        self._amp: float = self._config["amplitude_N"]
 
     @property
     def f_start(self) -> float:
@@ -827,3 +778,13 @@ class SinSweepController(Controller):
         self._force = self.amp * np.sin(phase)
 
         return self._force
+
+
+# コントローラ種別とクラスの対応表 (table mapping controller types to classes)
+_CONTROLLER_TYPES: dict[str, type[Controller]] = {
+    "PID": PIDController,
+    "impulse": ImpulseController,
+    "step": StepController,
+    "sin": SinusoidalController,
+    "sinsweep": SinSweepController,
+}
@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pandas as pd
 
 from tkmotion.time.discrete_time import DiscreteTimeLoader
@@ -25,6 +27,9 @@ from tkmotion.plant.plant import Plant
 from tkmotion.prof.motion_profile import MotionProfileLoader
 from tkmotion.prof.motion_profile import MotionProfile
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 # モーションフローモジュールのバージョン情報
 # (motion flow module version information)
@@ -101,12 +106,10 @@ class MotionFlow:
             None
 
         Raises:
-            ValueError: モーションプロファイルの読込に失敗した場合に発生
+            MotionProfileLoadError: モーションプロファイルの読込に失敗した場合に発生
               (If loading motion profile fails)
         """
         self._motion_profile = MotionProfileLoader().load(filepath, prof_index)
-        if self._motion_profile is None:
-            raise ValueError("Failed to load motion profile.")
 
     def load_controller(
         self, filepath="tkmotion/ctrl/default_controller_config.json", ctrl_index=0
@@ -177,6 +180,84 @@ class MotionFlow:
             pd.DataFrame: シミュレーション結果のデータフレーム
             (DataFrame of simulation results)
 
+        Raises:
+            ValueError: 必要な設定がロードされていない場合に発生
+              (If required configurations are not loaded)
+        """
+        return pd.DataFrame(self._simulate())
+
+    def execute_arrow(self) -> pa.Table:
+        """モーションシミュレーションを実行し、結果をArrowテーブルで返す
+        (Execute motion simulation and return the results as an Arrow table)
+
+        pandasを経由せず、観測データから直接Arrowテーブルを作成する。
+        (Builds the Arrow table directly from the observed data without pandas.)
+
+        Returns:
+            pa.Table: シミュレーション結果のArrowテーブル
+            (Arrow table of simulation results)
+
+        Raises:
+            ValueError: 必要な設定がロードされていない場合に発生
+              (If required configurations are not loaded)
+            ImportError: pyarrowがインストールされていない場合に発生
+              (If pyarrow is not installed)
+        """
+        import pyarrow as pa
+
+        return pa.Table.from_pydict(self._simulate())
+
+    def execute_sweep(self, controllers: list[Controller]) -> list[pd.DataFrame]:
+        """コントローラを切り替えながらモーションシミュレーションを繰り返し実行する
+        (Execute motion simulation repeatedly while switching controllers)
+
+        各試行は、呼び出し時点のプラント状態と、リセットしたモーションプロファイルから開始する。
+        (Each run starts from the plant state at the time of the call
+         and from a reset motion profile.)
+
+        Args:
+            controllers (list[Controller]): 試行するコントローラのリスト
+              (List of controllers to run)
+
+        Returns:
+            list[pd.DataFrame]: コントローラ毎のシミュレーション結果
+            (Simulation results for each controller)
+
+        Raises:
+            ValueError: 必要な設定がロードされていない場合に発生
+              (If required configurations are not loaded)
+        """
+        if self._plant is None:
+            raise ValueError("Plant not loaded. Call load_plant() first.")
+
+        if self._motion_profile is None:
+            raise ValueError(
+                "Motion profile not loaded. Call load_motion_profile() first."
+            )
+
+        # 力の成分を含む初期状態を保存する (save the initial state including force components)
+        phyobj = self._plant.physical_obj
+        init_state = phyobj.pack_state()
+        orig_controller = self._controller
+        results = []
+        try:
+            for controller in controllers:
+                self._controller = controller
+                phyobj.unpack_state(init_state)
+                self._motion_profile.reset()
+                results.append(pd.DataFrame(self._simulate()))
+        finally:
+            self._controller = orig_controller
+        return results
+
+    def _simulate(self) -> dict[str, list]:
+        """モーションシミュレーションを実行し、列名と観測データの辞書を返す
+        (Execute motion simulation and return a dictionary of column names and observed data)
+
+        Returns:
+            dict[str, list]: シミュレーション結果の列辞書
+            (Column dictionary of simulation results)
+
         Raises:
             ValueError: 必要な設定がロードされていない場合に発生
               (If required configurations are not loaded)
@@ -195,11 +276,11 @@ class MotionFlow:
                 "Motion profile not loaded. Call load_motion_profile() first."
             )
 
-        # 時間ステップ生成器 (time step generator)
-        time_steps_gen = self._discrete_time.get_time_step_generator()
+        # 時間ステップ (time steps)
+        time_arr = self._discrete_time.get_time_array()
+        time_list = time_arr.tolist()
 
-        # データ収集リスト (lists for data acquisition)
-        time_list = []
+        # データ収集 (data acquisition)
         motion_prof_observer = self._motion_profile.get_observer()
         controller_observer = self._controller.get_observer()
         phyobj_observer = self._plant.physical_obj.get_observer()
@@ -210,44 +291,38 @@ class MotionFlow:
         # プラント状態の初期化は、execute()呼び出し前に、excute()呼び出し側で行う
         # (The initialization of the plant state is performed by the caller before calling execute())
 
-        # 時間ステップ毎のシミュレーション (simulation for each time step)
-        for t in time_steps_gen:
-            time_list.append(t)
+        # 指令速度と位置を全時間ステップについて一括で計算する
+        # (calculate command velocity and position for all time steps at once)
+        cmd_vel_arr, cmd_pos_arr = self._motion_profile.calculate_cmd_vel_pos_array(
+            time_arr
+        )
+        motion_prof_observer.observe_array(cmd_vel_arr, cmd_pos_arr)
 
-            # 指令速度と位置 (command velocity and position)
-            cmd_vel, cmd_pos = self._motion_profile.calculate_cmd_vel_pos(t)
-            motion_prof_observer.observe()
+        # ループ内で不変な値と関数を事前に取得する
+        # (bind loop-invariant values and methods before the loop)
+        dt = self._discrete_time.dt
+        phyobj = self._plant.physical_obj
+        calculate_force = self._controller.calculate_force
+        apply_force = phyobj.apply_force
+        observe_controller = controller_observer.observe
+        observe_phyobj = phyobj_observer.observe
 
+        # 時間ステップ毎のシミュレーション (simulation for each time step)
+        for t, cmd_vel, cmd_pos in zip(
+            time_list, cmd_vel_arr.tolist(), cmd_pos_arr.tolist()
+        ):
             # サーボ推力計算 (servo force calculation)
-            force = self._controller.calculate_force(
-                t,
-                cmd_vel,
-                cmd_pos,
-                self._plant.physical_obj.vel,
-                self._plant.physical_obj.pos,
-            )
-            controller_observer.observe()
+            force = calculate_force(t, cmd_vel, cmd_pos, phyobj.vel, phyobj.pos)
+            observe_controller()
 
             # 物理オブジェクト状態更新 (physical object state update)
-            phyobj_observer.observe()  # 経過時間tでの状態を観測 (observe state at elapsed time t)
-            self._plant.physical_obj.apply_force(
-                force, self._discrete_time.dt
-            )  # 離散時間dtで状態更新 (update state with discrete time dt)
-
-        # シミュレーション結果のデータフレーム作成 (create DataFrame of simulation results)
-        result_df = pd.DataFrame(
-            {
-                "time_s": time_list,
-            }
-        )
-
-        for key, value in motion_prof_observer.get_observed_data().items():
-            result_df[key] = value
-
-        for key, value in controller_observer.get_observed_data().items():
-            result_df[key] = value
+            observe_phyobj()  # 経過時間tでの状態を観測 (observe state at elapsed time t)
+            apply_force(force, dt)  # 離散時間dtで状態更新 (update state with discrete time dt)
 
-        for key, value in phyobj_observer.get_observed_data().items():
-            result_df[key] = value
+        # シミュレーション結果の列辞書作成 (create column dictionary of simulation results)
+        result = {"time_s": time_list}
+        result.update(motion_prof_observer.get_observed_data())
+        result.update(controller_observer.get_observed_data())
+        result.update(phyobj_observer.get_observed_data())
 
-        return result_df
+        return result
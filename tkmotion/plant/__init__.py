@@ -15,3 +15,4 @@
 from tkmotion.plant.plant import PlantLoader  # noqa: F401
 from tkmotion.plant.plant import Plant  # noqa: F401
 from tkmotion.plant.physical_object import PhysicalObject  # noqa: F401
+from tkmotion.plant.physical_object import PhysicalObjectBatch  # noqa: F401
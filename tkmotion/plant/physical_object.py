@@ -14,6 +14,13 @@
 
 from __future__ import annotations
 
+import struct
+from array import array
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import numpy as np
+
 from tkmotion.util.utility import Utility
 from tkmotion.util.utility import ConfigVersionIncompatibleError
 
@@ -29,6 +36,25 @@ class PhysicalObject:
     # 重力加速度 [m/s^2] (gravitational acceleration)
     grav_acc_m_s2: float = 9.80665
 
+    __slots__ = (
+        "_config",
+        "_mass",
+        "_inv_mass",
+        "_acc",
+        "_prev_acc",
+        "_vel",
+        "_prev_vel",
+        "_pos",
+        "_prev_pos",
+    )
+
+    # 設定辞書の必須キー (required keys of the configuration dictionary)
+    _REQUIRED_KEYS: tuple[str, ...] = ("version", "mass_kg")
+
+    # 状態のバイナリ形式 (binary format of the state)
+    # (acc, prev_acc, vel, prev_vel, pos, prev_pos)
+    _STATE_FMT: struct.Struct = struct.Struct("6d")
+
     def __init__(self, config: dict) -> None:
         """PhysicalObjectを初期化する (Initializes PhysicalObject)
 
@@ -37,36 +63,31 @@ class PhysicalObject:
               (If configuration version is not compatible with module version)
             KeyError: 物理オブジェクト設定辞書に必要なキーが存在しない場合に発生
               (If required keys do not exist in the physical object configuration dictionary)
+            ValueError: 質量が正の値でない場合に発生 (If the mass is not positive)
         """
         self._config: dict = config
-        try:
-            # 設定バージョン互換性確認 (Check configuration version compatibility)
-            is_compatible = Utility.is_config_compatible(
-                module_version, self._config["version"]
+        Utility.require_keys(config, self._REQUIRED_KEYS, "physical object")
+
+        # 設定バージョン互換性確認 (Check configuration version compatibility)
+        config_version = config["version"]
+        is_compatible = Utility.is_config_compatible(module_version, config_version)
+        if not is_compatible:
+            raise ConfigVersionIncompatibleError(
+                f"Incompatible physical object config version: "
+                f"module_version={module_version}, "
+                f"config_version={config_version}"
             )
-            if not is_compatible:
-                raise ConfigVersionIncompatibleError(
-                    f"Incompatible physical object config version: "
-                    f"module_version={module_version}, "
-                    f"config_version={self._config['version']}"
-                )
-            # 属性設定 (Set attributes)
-            try:
-                self._mass: float = float(self._config["mass_kg"])
-            except KeyError as e:
-                raise KeyError(
-                    f"Missing 'mass_kg' in physical object configuration: {type(e)} {e}"
-                )
+        # 属性設定 (Set attributes)
+        self._mass: float = self._check_mass(float(config["mass_kg"]))
+        # 質量の逆数 (reciprocal of mass)
+        self._inv_mass: float = 1.0 / self._mass
 
-            self._acc = 0.0
-            self._prev_acc = 0.0
-            self._vel = 0.0
-            self._prev_vel = 0.0
-            self._pos = 0.0
-            self._prev_pos = 0.0
-        except Exception as e:
-            print(f"Error initializing physical object: {type(e)} {e}")
-            raise e
+        self._acc = 0.0
+        self._prev_acc = 0.0
+        self._vel = 0.0
+        self._prev_vel = 0.0
+        self._pos = 0.0
+        self._prev_pos = 0.0
 
     @property
     def module_version(self) -> str:
@@ -90,8 +111,24 @@ class PhysicalObject:
 
     @mass.setter
     def mass(self, value: float) -> None:
-        """物理オブジェクトの質量 [kg] (Mass of the physical object)"""
-        self._mass = value
+        """物理オブジェクトの質量 [kg] (Mass of the physical object)
+
+        Raises:
+            ValueError: 質量が正の値でない場合に発生 (If the mass is not positive)
+        """
+        self._mass = self._check_mass(value)
+        self._inv_mass = 1.0 / value
+
+    @staticmethod
+    def _check_mass(mass: float) -> float:
+        """質量が正の値であることを確認する (Checks that the mass is positive)
+
+        Raises:
+            ValueError: 質量が正の値でない場合に発生 (If the mass is not positive)
+        """
+        if not mass > 0.0:
+            raise ValueError(f"mass must be positive: mass_kg={mass}")
+        return mass
 
     @property
     def acc(self) -> float:
@@ -177,24 +214,246 @@ class PhysicalObject:
         self.pos = pos
         self._prev_pos = pos
 
+    def pack_state(self) -> bytes:
+        """物理オブジェクトの状態をバイト列に変換する
+        (Packs the state of the physical object into bytes)
+
+        Returns:
+            bytes: 状態のバイト列 (float64 × 6) (State bytes (float64 x 6))
+        """
+        return self._STATE_FMT.pack(
+            self._acc,
+            self._prev_acc,
+            self._vel,
+            self._prev_vel,
+            self._pos,
+            self._prev_pos,
+        )
+
+    def unpack_state(self, buf: bytes) -> None:
+        """バイト列から物理オブジェクトの状態を復元する
+        (Restores the state of the physical object from bytes)
+
+        Args:
+            buf (bytes): pack_stateで作成した状態のバイト列 (State bytes created by pack_state)
+
+        Raises:
+            struct.error: バイト列の長さが不正な場合に発生 (If the length of the bytes is invalid)
+        """
+        (
+            self._acc,
+            self._prev_acc,
+            self._vel,
+            self._prev_vel,
+            self._pos,
+            self._prev_pos,
+        ) = self._STATE_FMT.unpack(buf)
+
     def apply_force(self, force: float, dt: float) -> None:
         """物理オブジェクトに力を適用し、状態を更新する
         (Applies force to the physical object and updates state)"""
 
+        # プロパティのセッタを経由せず、前回値の保存と状態更新を直接行う
+        # (save previous values and update state directly, bypassing property setters)
+
         # 力Fを与えると、質量mの物体に加速度aが生じる (F = m*a より a = F/m)
         # (when force F is applied, acceleration a occurs in mass m object)
-        self.acc = force / self.mass
+        acc = force * self._inv_mass
+        self._prev_acc = self._acc
+        self._acc = acc
 
         # 加速度aが生じると、速度vが変化 (v = u + a*t)
         # (when acceleration a occurs, velocity v changes)
-        self.vel += self.acc * dt
+        prev_vel = self._vel
+        self._prev_vel = prev_vel
+        self._vel += acc * dt
 
         # 速度vが変化すると、位置xが変化 (x = x0 + v*t)
         # (when velocity v changes, position x changes)
         # 前回速度による変化分 + 今回加速度による変化分
         # (position changes due to previous velocity
         #  + position changes due to current acceleration)
-        self.pos += self.prev_vel * dt + 0.5 * self.acc * (dt**2)
+        # x += v0*t + a*t^2/2 を t*(v0 + a*t/2) の形で計算する
+        # (calculate x += v0*t + a*t^2/2 in the form t*(v0 + a*t/2))
+        self._prev_pos = self._pos
+        self._pos += dt * (prev_vel + 0.5 * dt * acc)
+
+    def apply_force_series(
+        self, forces: np.ndarray, dt: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """力の時系列を順に適用し、各ステップ後の状態を一括で計算する
+        (Applies a series of forces in order and calculates the state after each step at once)
+
+        apply_forceを時系列の各要素に対して順に呼び出した場合と同じ結果となる。
+        (The result equals calling apply_force for each element of the series in order.)
+
+        Args:
+            forces (np.ndarray): 各ステップで加える力 [N] (Force applied at each step)
+            dt (float): 離散時間ステップ [s] (Discrete time step)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: 各ステップ後の加速度 [m/s^2]、速度 [m/s]、位置 [m]
+            (acceleration, velocity and position after each step)
+        """
+        # a = F/m
+        acc = np.asarray(forces, dtype=np.float64) * self._inv_mass
+        n = acc.shape[0]
+        if n == 0:
+            return acc, acc.copy(), acc.copy()
+
+        # v = u + a*t を累積和で計算する (初期速度を先頭に加える)
+        # (calculate v = u + a*t as a cumulative sum, with the initial velocity added to the head)
+        dv = acc * dt
+        dv[0] += self._vel
+        vel = np.cumsum(dv)
+
+        # 前回速度による変化分 + 今回加速度による変化分を累積和で計算する
+        # (accumulate position changes due to previous velocity
+        #  + position changes due to current acceleration)
+        prev_vel = np.empty_like(vel)
+        prev_vel[0] = self._vel
+        prev_vel[1:] = vel[:-1]
+        dp = dt * (prev_vel + (0.5 * dt) * acc)
+        dp[0] += self._pos
+        pos = np.cumsum(dp)
+
+        # 最終ステップの状態を書き戻す (write back the state of the last step)
+        if n > 1:
+            self._prev_acc = float(acc[-2])
+            self._prev_vel = float(vel[-2])
+            self._prev_pos = float(pos[-2])
+        else:
+            self._prev_acc = self._acc
+            self._prev_vel = self._vel
+            self._prev_pos = self._pos
+        self._acc = float(acc[-1])
+        self._vel = float(vel[-1])
+        self._pos = float(pos[-1])
+
+        return acc, vel, pos
+
+
+class PhysicalObjectBatch:
+    """物理オブジェクト一括計算クラス (Physical Object Batch Class)
+
+    複数の物理オブジェクトの状態を配列 (Structure of Arrays) で保持し、一括で更新する。
+    (Holds the states of multiple physical objects as arrays (Structure of Arrays)
+     and updates them all at once.)
+    """
+
+    def __init__(self, masses: np.ndarray, dtype: np.dtype = np.float64) -> None:
+        """PhysicalObjectBatchを初期化する (Initializes PhysicalObjectBatch)
+
+        np.float32を指定すると転送量が半分になるが、状態の累積誤差は大きくなる。
+        (Specifying np.float32 halves the memory traffic,
+         but the accumulated error of the states grows.)
+
+        Args:
+            masses (np.ndarray): 各物理オブジェクトの質量 [kg] (Mass of each physical object)
+            dtype (np.dtype): 状態配列の浮動小数点型 (Floating point type of the state arrays)
+
+        Raises:
+            ValueError: dtypeが浮動小数点型でない場合、または質量が1次元配列でない場合に発生
+              (If dtype is not a floating point type, or masses is not a 1-D array)
+        """
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError(f"dtype must be a floating point type: dtype={dtype}")
+        self._mass: np.ndarray = np.array(masses, dtype=dtype)
+        if self._mass.ndim != 1:
+            raise ValueError(f"masses must be a 1-D array: shape={self._mass.shape}")
+        self._inv_mass: np.ndarray = 1.0 / self._mass
+        self._acc: np.ndarray = np.zeros_like(self._mass)
+        self._prev_acc: np.ndarray = np.zeros_like(self._mass)
+        self._vel: np.ndarray = np.zeros_like(self._mass)
+        self._prev_vel: np.ndarray = np.zeros_like(self._mass)
+        self._pos: np.ndarray = np.zeros_like(self._mass)
+        self._prev_pos: np.ndarray = np.zeros_like(self._mass)
+        # 一時配列 (temporary arrays)
+        self._tmp: np.ndarray = np.empty_like(self._mass)
+
+    def __len__(self) -> int:
+        """物理オブジェクトの数 (Number of physical objects)"""
+        return self._mass.shape[0]
+
+    @property
+    def dtype(self) -> np.dtype:
+        """状態配列の浮動小数点型 (Floating point type of the state arrays)"""
+        return self._mass.dtype
+
+    @property
+    def mass(self) -> np.ndarray:
+        """各物理オブジェクトの質量 [kg] (Mass of each physical object)"""
+        return self._mass
+
+    @property
+    def acc(self) -> np.ndarray:
+        """各物理オブジェクトの加速度 [m/s^2] (Acceleration of each physical object)"""
+        return self._acc
+
+    @property
+    def prev_acc(self) -> np.ndarray:
+        """各物理オブジェクトの前回の加速度 [m/s^2] (Previous acceleration of each physical object)"""
+        return self._prev_acc
+
+    @property
+    def vel(self) -> np.ndarray:
+        """各物理オブジェクトの速度 [m/s] (Velocity of each physical object)"""
+        return self._vel
+
+    @property
+    def prev_vel(self) -> np.ndarray:
+        """各物理オブジェクトの前回の速度 [m/s] (Previous velocity of each physical object)"""
+        return self._prev_vel
+
+    @property
+    def pos(self) -> np.ndarray:
+        """各物理オブジェクトの位置 [m] (Position of each physical object)"""
+        return self._pos
+
+    @property
+    def prev_pos(self) -> np.ndarray:
+        """各物理オブジェクトの前回の位置 [m] (Previous position of each physical object)"""
+        return self._prev_pos
+
+    def reset(self) -> None:
+        """全物理オブジェクトの状態をリセットする (Reset the state of all physical objects)"""
+        for state in (
+            self._acc,
+            self._prev_acc,
+            self._vel,
+            self._prev_vel,
+            self._pos,
+            self._prev_pos,
+        ):
+            state.fill(0.0)
+
+    def apply_force(self, forces: np.ndarray, dt: float) -> None:
+        """各物理オブジェクトに力を適用し、状態を一括で更新する
+        (Applies forces to each physical object and updates all states at once)
+
+        Args:
+            forces (np.ndarray): 各物理オブジェクトに加える力 [N] (Force applied to each physical object)
+            dt (float): 離散時間ステップ [s] (Discrete time step)
+        """
+        # a = F/m
+        np.copyto(self._prev_acc, self._acc)
+        np.multiply(forces, self._inv_mass, out=self._acc)
+
+        # v = u + a*t
+        np.copyto(self._prev_vel, self._vel)
+        np.multiply(self._acc, dt, out=self._tmp)
+        self._vel += self._tmp
+
+        # 前回速度による変化分 + 今回加速度による変化分
+        # (position changes due to previous velocity
+        #  + position changes due to current acceleration)
+        # t*(v0 + a*t/2) の形で一時配列1つで計算する
+        # (calculate in the form t*(v0 + a*t/2) with a single temporary array)
+        np.copyto(self._prev_pos, self._pos)
+        np.multiply(self._acc, 0.5 * dt, out=self._tmp)
+        self._tmp += self._prev_vel
+        self._tmp *= dt
+        self._pos += self._tmp
 
 
 class PhysicalObjectObserver:
@@ -203,9 +462,19 @@ class PhysicalObjectObserver:
     def __init__(self, physical_obj: PhysicalObject) -> None:
         """PhysicalObjectObserverを初期化する (Initializes PhysicalObjectObserver)"""
         self._physical_obj: PhysicalObject = physical_obj
-        self._obj_acc_list: list[float] = []
-        self._obj_vel_list: list[float] = []
-        self._obj_pos_list: list[float] = []
+        # 観測データはfloat64の配列に格納する (observed data is stored in float64 arrays)
+        self._obj_acc_list: array[float] = array("d")
+        self._obj_vel_list: array[float] = array("d")
+        self._obj_pos_list: array[float] = array("d")
+        # 列名と観測データ配列の対応 (mapping of column names to observed data arrays)
+        self._buffers: dict[str, array[float]] = {
+            "obj_acceleration_m_s2": self._obj_acc_list,
+            "obj_velocity_m_s": self._obj_vel_list,
+            "obj_position_m": self._obj_pos_list,
+        }
+        # 観測データのキャッシュ (observed data cache)
+        # observeとresetで無効化する (invalidated by observe and reset)
+        self._observed_data: Mapping[str, np.ndarray] | None = None
 
     @property
     def physical_obj(self) -> PhysicalObject:
@@ -214,33 +483,77 @@ class PhysicalObjectObserver:
 
     def reset(self) -> None:
         """観測データをリセットする (Resets the observed data)"""
-        self._obj_acc_list.clear()
-        self._obj_vel_list.clear()
-        self._obj_pos_list.clear()
+        self._observed_data = None
+        del self._obj_acc_list[:]
+        del self._obj_vel_list[:]
+        del self._obj_pos_list[:]
 
     def observe(self) -> None:
         """物理オブジェクトの状態を観測し、データリストに追加する
         (Observes the state of the physical object and adds to data list)"""
+        self._observed_data = None
         self._obj_acc_list.append(self._physical_obj.acc)
         self._obj_vel_list.append(self._physical_obj.vel)
         self._obj_pos_list.append(self._physical_obj.pos)
 
-    def get_observed_data(self) -> dict:
-        """観測データを辞書形式で返す (Return the observed data in dictionary format)
+    def get_observed_data(self) -> Mapping[str, np.ndarray]:
+        """観測データを読み取り専用の辞書形式で返す
+        (Return the observed data as a read-only dictionary)
+
+        観測データ配列は、最初の呼び出し時に1回のバッファコピーで読み取り専用の
+        NumPy配列に変換してキャッシュする。次にobserveまたはresetが呼ばれるまでは、
+        キャッシュをそのまま返す。返される配列は観測者とは独立しており、
+        その後のobserveやresetの影響を受けない。
+        (On the first call, each observed data array is converted to a read-only
+         NumPy array with one buffer copy and cached. The cache is returned as is
+         until observe or reset is called. The returned arrays are independent
+         of the observer and are not affected by later observe or reset calls.)
 
         Returns:
-            dict: 観測データ辞書 (Observed data dictionary)
+            Mapping[str, np.ndarray]: 読み取り専用の観測データ辞書
+            (Read-only observed data dictionary)
         """
-        return {
-            "obj_acceleration_m_s2": self._obj_acc_list,
-            "obj_velocity_m_s": self._obj_vel_list,
-            "obj_position_m": self._obj_pos_list,
-        }
+        if self._observed_data is None:
+            data = {}
+            for name, buf in self._buffers.items():
+                values = np.array(buf)
+                values.setflags(write=False)
+                data[name] = values
+            self._observed_data = MappingProxyType(data)
+        return self._observed_data
 
 
 class MDSPhysicalObject(PhysicalObject):
     """質量・減衰器・ばね 物理オブジェクトクラス (Mass-Damper-Spring Physical Object Class)"""
 
+    __slots__ = (
+        "_damper",
+        "_spring",
+        "_spring_balance_pos",
+        "_static_friction_coeff",
+        "_dynamic_friction_coeff",
+        "_neg_damper",
+        "_neg_spring",
+        "_spring_kx0",
+        "_damper_force",
+        "_spring_force",
+        "_net_force",
+        "_test_flag",
+    )
+
+    # 設定辞書の必須キー (required keys of the configuration dictionary)
+    _REQUIRED_KEYS: tuple[str, ...] = PhysicalObject._REQUIRED_KEYS + (
+        "damper_Ns_m",
+        "spring_N_m",
+        "spring_balance_pos_m",
+        "static_friction_coeff",
+        "dynamic_friction_coeff",
+    )
+
+    # 状態のバイナリ形式 (binary format of the state)
+    # (acc, prev_acc, vel, prev_vel, pos, prev_pos, damper_force, spring_force, net_force)
+    _STATE_FMT: struct.Struct = struct.Struct("9d")
+
     def __init__(self, config: dict) -> None:
         """MDSPhysicalObjectを初期化する (Initializes MDSPhysicalObject)
 
@@ -253,62 +566,32 @@ class MDSPhysicalObject(PhysicalObject):
               (If required keys do not exist in the MDS physical object configuration dictionary)
         """
         super().__init__(config)
-        try:
-            # ダンパ係数 (damper coefficient)
-            try:
-                self._damper: float = float(self._config["damper_Ns_m"])
-            except KeyError as e:
-                raise KeyError(
-                    f"Missing 'damper_Ns_m' in MDS physical object configuration: {type(e)} {e}"
-                )
+        # 必須キーは基底クラスで確認済み (required keys are checked by the base class)
 
-            # ばね係数 (spring coefficient)
-            try:
-                self._spring: float = float(self._config["spring_N_m"])
-            except KeyError as e:
-                raise KeyError(
-                    f"Missing 'spring_N_m' in MDS physical object configuration: {type(e)} {e}"
-                )
+        # ダンパ係数 (damper coefficient)
+        self._damper: float = float(config["damper_Ns_m"])
 
-            # ばね平衡位置 (spring balance position)
-            try:
-                self._spring_balance_pos: float = float(
-                    self._config["spring_balance_pos_m"]
-                )
-            except KeyError as e:
-                raise KeyError(
-                    f"Missing 'spring_balance_pos_m' in MDS physical object configuration: {type(e)} {e}"
-                )
+        # ばね係数 (spring coefficient)
+        self._spring: float = float(config["spring_N_m"])
 
-            # 静止摩擦係数 (static friction coefficient)
-            try:
-                self._static_friction_coeff: float = float(
-                    self._config["static_friction_coeff"]
-                )
-            except KeyError as e:
-                raise KeyError(
-                    f"Missing 'static_friction_coeff' in MDS physical object configuration: {type(e)} {e}"
-                )
+        # ばね平衡位置 (spring balance position)
+        self._spring_balance_pos: float = float(config["spring_balance_pos_m"])
 
-            # 動摩擦係数 (dynamic friction coefficient)
-            try:
-                self._dynamic_friction_coeff: float = float(
-                    self._config["dynamic_friction_coeff"]
-                )
-            except KeyError as e:
-                raise KeyError(
-                    f"Missing 'dynamic_friction_coeff' in MDS physical object configuration: {type(e)} {e}"
-                )
+        # 静止摩擦係数 (static friction coefficient)
+        self._static_friction_coeff: float = float(config["static_friction_coeff"])
 
-            self._damper_force = 0.0
-            self._spring_force = 0.0
-            self._net_force = 0.0
+        # 動摩擦係数 (dynamic friction coefficient)
+        self._dynamic_friction_coeff: float = float(config["dynamic_friction_coeff"])
 
-            self._test_flag = False
+        # 力の計算用の定数 (constants for the force calculation)
+        self._update_damper_consts()
+        self._update_spring_consts()
 
-        except Exception as e:
-            print(f"Error initializing MDS physical object: {type(e)} {e}")
-            raise e
+        self._damper_force = 0.0
+        self._spring_force = 0.0
+        self._net_force = 0.0
+
+        self._test_flag = False
 
     @property
     def damper(self) -> float:
@@ -319,6 +602,7 @@ class MDSPhysicalObject(PhysicalObject):
     def damper(self, value: float):
         """ダンパ係数 [Ns/m] (Damper coefficient)"""
         self._damper = value
+        self._update_damper_consts()
 
     @property
     def spring(self) -> float:
@@ -329,6 +613,7 @@ class MDSPhysicalObject(PhysicalObject):
     def spring(self, value: float):
         """ばね係数 [N/m] (Spring coefficient)"""
         self._spring = value
+        self._update_spring_consts()
 
     @property
     def spring_balance_pos(self) -> float:
@@ -339,6 +624,7 @@ class MDSPhysicalObject(PhysicalObject):
     def spring_balance_pos(self, value: float):
         """ばね平衡位置 [m] (Spring balance position)"""
         self._spring_balance_pos = value
+        self._update_spring_consts()
 
     @property
     def static_friction_coeff(self) -> float:
@@ -360,6 +646,17 @@ class MDSPhysicalObject(PhysicalObject):
         """動摩擦係数 (Dynamic friction coefficient)"""
         self._dynamic_friction_coeff = value
 
+    def _update_damper_consts(self) -> None:
+        """減衰器力の計算用の定数を更新する (Updates the constants for the damper force)"""
+        # Fd = -c*v
+        self._neg_damper = -self._damper
+
+    def _update_spring_consts(self) -> None:
+        """ばね力の計算用の定数を更新する (Updates the constants for the spring force)"""
+        # Fs = -k*(x - x0) = (-k)*x + k*x0
+        self._neg_spring = -self._spring
+        self._spring_kx0 = self._spring * self._spring_balance_pos
+
     def get_observer(self) -> MDSPhysicalObjectObserver:
         """物理オブジェクトの観測者を取得する (Gets the observer of the physical object)
 
@@ -376,28 +673,74 @@ class MDSPhysicalObject(PhysicalObject):
         self._spring_force = 0.0
         self._net_force = 0.0
 
+    def pack_state(self) -> bytes:
+        """物理オブジェクトの状態をバイト列に変換する
+        (Packs the state of the physical object into bytes)
+
+        Returns:
+            bytes: 状態のバイト列 (float64 × 9) (State bytes (float64 x 9))
+        """
+        return self._STATE_FMT.pack(
+            self._acc,
+            self._prev_acc,
+            self._vel,
+            self._prev_vel,
+            self._pos,
+            self._prev_pos,
+            self._damper_force,
+            self._spring_force,
+            self._net_force,
+        )
+
+    def unpack_state(self, buf: bytes) -> None:
+        """バイト列から物理オブジェクトの状態を復元する
+        (Restores the state of the physical object from bytes)
+
+        Args:
+            buf (bytes): pack_stateで作成した状態のバイト列 (State bytes created by pack_state)
+
+        Raises:
+            struct.error: バイト列の長さが不正な場合に発生 (If the length of the bytes is invalid)
+        """
+        (
+            self._acc,
+            self._prev_acc,
+            self._vel,
+            self._prev_vel,
+            self._pos,
+            self._prev_pos,
+            self._damper_force,
+            self._spring_force,
+            self._net_force,
+        ) = self._STATE_FMT.unpack(buf)
+
     def apply_force(self, ex_force: float, dt: float) -> None:
         """物理オブジェクトに力を適用し、状態を更新する (Applies force to the physical object and updates state)"""
 
+        # プロパティのセッタを経由せず、前回値の保存と状態更新を直接行う
+        # (save previous values and update state directly, bypassing property setters)
+        vel = self._vel
+        pos = self._pos
+
         # 減衰器による力Fd = -c*v
         # (force by damper Fd = -c*v)
-        self._damper_force = -self.damper * self.vel
+        damper_force = self._neg_damper * vel
 
         # ばねによる力Fs = -k*x
         # (force by spring Fs = -k*x)
-        self._spring_force = -self.spring * (self.pos - self.spring_balance_pos)
+        spring_force = self._neg_spring * pos + self._spring_kx0
 
         # 摩擦力 (friction force)
         # https://www.heidon.co.jp/archives/2269
         max_sfric_force = (
-            self.static_friction_coeff * self.mass * PhysicalObject.grav_acc_m_s2
+            self._static_friction_coeff * self._mass * PhysicalObject.grav_acc_m_s2
         )
         dfric_force = (
-            self.dynamic_friction_coeff * self.mass * PhysicalObject.grav_acc_m_s2
+            self._dynamic_friction_coeff * self._mass * PhysicalObject.grav_acc_m_s2
         )
         friction_force = 0.0
-        if abs(self.vel) < 1e-6:
-            total_other_forces = ex_force + self._damper_force + self._spring_force
+        if abs(vel) < 1e-6:
+            total_other_forces = ex_force + damper_force + spring_force
             if abs(total_other_forces) < max_sfric_force:
                 # 静止摩擦力が他の力を相殺できる場合、摩擦力は他の力と逆向きで等しい
                 # (if static friction can cancel other forces,
@@ -413,28 +756,127 @@ class MDSPhysicalObject(PhysicalObject):
         else:
             # 速度がある場合、動摩擦力を適用
             # (if there is velocity, apply dynamic friction)
-            friction_force = -dfric_force * (self.vel / abs(self.vel))
+            friction_force = -dfric_force * (vel / abs(vel))
 
         # 合力F = 外力 + 減衰器力 + ばね力 + 摩擦力
         # (net force F = external force + damper force + spring force + friction force)
-        self._net_force = (
-            ex_force + self._damper_force + self._spring_force + friction_force
-        )
+        net_force = ex_force + damper_force + spring_force + friction_force
+        self._damper_force = damper_force
+        self._spring_force = spring_force
+        self._net_force = net_force
 
         # 力Fを与えると、質量mの物体に加速度aが生じる (F = m*a より a = F/m)
         # (when force F is applied, acceleration a occurs in mass m object)
-        self.acc = self._net_force / self.mass
+        acc = net_force * self._inv_mass
+        self._prev_acc = self._acc
+        self._acc = acc
 
         # 加速度aが生じると、速度vが変化 (v = u + a*t)
         # (when acceleration a occurs, velocity v changes)
-        self.vel += self.acc * dt
+        self._prev_vel = vel
+        self._vel = vel + acc * dt
 
         # 速度vが変化すると、位置xが変化 (x = x0 + v*t)
         # (when velocity v changes, position x changes)
         # 前回速度による変化分 + 今回加速度による変化分
         # (position changes due to previous velocity
         #  + position changes due to current acceleration)
-        self.pos += self.prev_vel * dt + 0.5 * self.acc * (dt**2)
+        self._prev_pos = pos
+        self._pos = pos + dt * (vel + 0.5 * dt * acc)
+
+    def apply_force_series(
+        self, forces: np.ndarray, dt: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """外力の時系列を順に適用し、各ステップ後の状態を返す
+        (Applies a series of external forces in order and returns the state after each step)
+
+        減衰器力・ばね力・摩擦力が状態に依存するため、ステップ毎に順に計算するが、
+        プロパティを経由せずローカル変数で計算する。apply_forceを順に呼び出した場合と同じ結果となる。
+        (Damper, spring and friction forces depend on the state, so each step is calculated in order,
+         but with local variables instead of properties.
+         The result equals calling apply_force for each element in order.)
+
+        Args:
+            forces (np.ndarray): 各ステップで加える外力 [N] (External force applied at each step)
+            dt (float): 離散時間ステップ [s] (Discrete time step)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: 各ステップ後の加速度 [m/s^2]、速度 [m/s]、位置 [m]
+            (acceleration, velocity and position after each step)
+        """
+        # ループ内で不変な値を事前に取得する (bind loop-invariant values before the loop)
+        neg_damper = self._neg_damper
+        neg_spring = self._neg_spring
+        spring_kx0 = self._spring_kx0
+        inv_mass = self._inv_mass
+        max_sfric_force = (
+            self._static_friction_coeff * self._mass * PhysicalObject.grav_acc_m_s2
+        )
+        dfric_force = (
+            self._dynamic_friction_coeff * self._mass * PhysicalObject.grav_acc_m_s2
+        )
+        half_dt = 0.5 * dt
+
+        # 状態をローカル変数で更新する (update the state in local variables)
+        a = self._acc
+        v = self._vel
+        x = self._pos
+        prev_a = self._prev_acc
+        prev_v = self._prev_vel
+        prev_x = self._prev_pos
+        damper_force = self._damper_force
+        spring_force = self._spring_force
+        net_force = self._net_force
+
+        acc_list: list[float] = []
+        vel_list: list[float] = []
+        pos_list: list[float] = []
+        append_acc = acc_list.append
+        append_vel = vel_list.append
+        append_pos = pos_list.append
+
+        for ex_force in np.asarray(forces, dtype=np.float64).tolist():
+            # 減衰器力・ばね力 (damper force and spring force)
+            damper_force = neg_damper * v
+            spring_force = neg_spring * x + spring_kx0
+
+            # 摩擦力 (friction force)
+            if abs(v) < 1e-6:
+                total_other_forces = ex_force + damper_force + spring_force
+                if abs(total_other_forces) < max_sfric_force:
+                    friction_force = -total_other_forces
+                else:
+                    friction_force = -dfric_force * (
+                        1.0 if total_other_forces > 0 else -1.0
+                    )
+            else:
+                friction_force = -dfric_force * (v / abs(v))
+
+            # 合力と状態更新 (net force and state update)
+            net_force = ex_force + damper_force + spring_force + friction_force
+            prev_a = a
+            a = net_force * inv_mass
+            prev_v = v
+            v += a * dt
+            prev_x = x
+            x += dt * (prev_v + half_dt * a)
+
+            append_acc(a)
+            append_vel(v)
+            append_pos(x)
+
+        # 最終ステップの状態を書き戻す (write back the state of the last step)
+        self._acc = a
+        self._vel = v
+        self._pos = x
+        self._prev_acc = prev_a
+        self._prev_vel = prev_v
+        self._prev_pos = prev_x
+        self._damper_force = damper_force
+        self._spring_force = spring_force
+        self._net_force = net_force
+
+        return np.array(acc_list), np.array(vel_list), np.array(pos_list)
 
     def calc_char_values(self) -> tuple[float, float, float, float]:
         """物理オブジェクトの理論特性値を計算する
@@ -469,9 +911,16 @@ class MDSPhysicalObjectObserver(PhysicalObjectObserver):
         """MDSPhysicalObjectObserverを初期化する (Initializes MDSPhysicalObjectObserver)"""
         super().__init__(physical_obj)
         self._physical_obj: MDSPhysicalObject = self._physical_obj
-        self._damper_force_list: list[float] = []
-        self._spring_force_list: list[float] = []
-        self._net_force_list: list[float] = []
+        self._damper_force_list: array[float] = array("d")
+        self._spring_force_list: array[float] = array("d")
+        self._net_force_list: array[float] = array("d")
+        self._buffers.update(
+            {
+                "damper_force_N": self._damper_force_list,
+                "spring_force_N": self._spring_force_list,
+                "net_force_N": self._net_force_list,
+            }
+        )
 
     @property
     def physical_obj(self) -> MDSPhysicalObject:
@@ -481,9 +930,9 @@ class MDSPhysicalObjectObserver(PhysicalObjectObserver):
     def reset(self) -> None:
         """観測データをリセットする (Resets observation data)"""
         super().reset()
-        self._damper_force_list.clear()
-        self._spring_force_list.clear()
-        self._net_force_list.clear()
+        del self._damper_force_list[:]
+        del self._spring_force_list[:]
+        del self._net_force_list[:]
 
     def observe(self) -> None:
         """物理オブジェクトの状態を観測し、データリストに追加する
@@ -492,19 +941,3 @@ class MDSPhysicalObjectObserver(PhysicalObjectObserver):
         self._damper_force_list.append(self.physical_obj._damper_force)
         self._spring_force_list.append(self.physical_obj._spring_force)
         self._net_force_list.append(self.physical_obj._net_force)
-
-    def get_observed_data(self) -> dict:
-        """観測データリストを返す (Returns the observation data list)
-
-        Returns:
-            list: 観測データリスト
-            (Observation data list)
-        """
-        return {
-            "obj_acceleration_m_s2": self._obj_acc_list,
-            "obj_velocity_m_s": self._obj_vel_list,
-            "obj_position_m": self._obj_pos_list,
-            "damper_force_N": self._damper_force_list,
-            "spring_force_N": self._spring_force_list,
-            "net_force_N": self._net_force_list,
-        }
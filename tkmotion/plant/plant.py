@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 
 from tkmotion.plant.physical_object import PhysicalObject
 from tkmotion.plant.physical_object import MDSPhysicalObject
@@ -27,6 +27,11 @@ from tkmotion.util.utility import ConfigVersionIncompatibleError
 # (plant module version information)
 module_version = "0.4.0"
 
+# 物理オブジェクト種別とクラスの対応表 (table mapping physical object types to classes)
+_PHYOBJ_TYPES: dict[str, type[PhysicalObject]] = {
+    "MDS": MDSPhysicalObject,
+}
+
 
 class PlantLoader:
     """プラント読込クラス (Plant Loader Class)"""
@@ -54,30 +59,61 @@ class PlantLoader:
             phyobj_index (int): 物理オブジェクト設定辞書のインデックス (Index of the physical object setting dictionary)
         """
         try:
-            with open(filepath, "r") as f:
-                config = json.load(f)
-                # 設定バージョン互換性確認 (Check configuration version compatibility)
-                is_compatible = Utility.is_config_compatible(
-                    module_version, config[0]["plant"][plant_index]["version"]
+            plant_config = Utility.load_json(filepath)[0]["plant"][plant_index]
+            # 設定バージョン互換性確認 (Check configuration version compatibility)
+            is_compatible = Utility.is_config_compatible(
+                module_version, plant_config["version"]
+            )
+            if not is_compatible:
+                raise ConfigVersionIncompatibleError(
+                    f"Incompatible plant config version: "
+                    f"module_version={module_version}, "
+                    f"config_version={plant_config['version']}"
                 )
-                if not is_compatible:
-                    raise ConfigVersionIncompatibleError(
-                        f"Incompatible plant config version: "
-                        f"module_version={module_version}, "
-                        f"config_version={config[0]['plant'][plant_index]['version']}"
-                    )
-                # プラントオブジェクト作成 (Create Plant object)
-                return Plant(config[0]["plant"][plant_index], phyobj_index)
+            # プラントオブジェクト作成 (Create Plant object)
+            return Plant(plant_config, phyobj_index)
         except Exception as e:
             print(f"Error loading plant: {type(e)} {e}")
         return None
 
+    def load_many(
+        self,
+        filepaths: list[str],
+        plant_index=0,
+        phyobj_index=0,
+        max_workers=8,
+    ) -> list[Plant | None]:
+        """複数のプラント設定JSONファイルを並行して読み込む
+        (Loads Plant configurations from multiple JSON files concurrently)
+
+        ファイルの読込をスレッドで並行させる。各ファイルはloadと同様に読み込まれ、
+        読込に失敗したファイルに対応する要素はNoneとなる。
+        (File reads are overlapped on threads. Each file is loaded as by load,
+         and the element for a file that fails to load is None.)
+
+        Args:
+            filepaths (list[str]): JSONファイルのパスのリスト (List of paths to the JSON files)
+            plant_index (int): プラント設定辞書のインデックス (Index of the plant setting dictionary)
+            phyobj_index (int): 物理オブジェクト設定辞書のインデックス (Index of the physical object setting dictionary)
+            max_workers (int): 最大スレッド数 (Maximum number of threads)
+
+        Returns:
+            list[Plant | None]: filepathsと同じ順序のプラントのリスト
+            (List of plants in the same order as filepaths)
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda filepath: self.load(filepath, plant_index, phyobj_index),
+                    filepaths,
+                )
+            )
+
     def load_MDS_plant_fromDB(self) -> Plant | None:
         """プラント設定をデータベースから読み込む (Loads Plant configuration from a database)"""
         try:
             dba = DBAccessor()
             params = dba.fetch_plant_params(1)
-            print(params)
 
             # jsonと同じ形式の辞書を作成してPlantオブジェクトを初期化する
             #  (Create a dictionary in the same format as JSON and initialize the Plant object)
@@ -110,6 +146,8 @@ class PlantLoader:
 class Plant:
     """プラント (制御対象) (Plant (Target System)) Class"""
 
+    __slots__ = ("_config", "_physical_object")
+
     def __init__(self, config: dict, phyobj_index=0) -> None:
         """Plantを初期化する (Initializes the Plant with given configuration)
 
@@ -124,15 +162,9 @@ class Plant:
         self._config: dict = config
         self._physical_object: PhysicalObject
         try:
-            match self._config["physical_object"][phyobj_index]["type"]:
-                case "MDS":
-                    self._physical_object = MDSPhysicalObject(
-                        self._config["physical_object"][phyobj_index]
-                    )
-                case _:
-                    self._physical_object = PhysicalObject(
-                        self._config["physical_object"][phyobj_index]
-                    )
+            phyobj_config = self._config["physical_object"][phyobj_index]
+            phyobj_cls = _PHYOBJ_TYPES.get(phyobj_config["type"], PhysicalObject)
+            self._physical_object = phyobj_cls(phyobj_config)
         except KeyError as e:
             raise KeyError(f"Missing 'physical_object' in configuration: {type(e)} {e}")
 
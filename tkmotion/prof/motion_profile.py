@@ -14,8 +14,9 @@
 
 from __future__ import annotations
 
+import math
 import numpy as np
-import json
+from collections.abc import Callable
 
 from tkmotion.util.utility import Utility
 from tkmotion.util.utility import ConfigVersionIncompatibleError
@@ -44,6 +45,92 @@ class MovingLengthZeroError(Exception):
     pass
 
 
+class MotionProfileLoadError(ValueError):
+    """モーションプロファイルの読込に失敗した場合に発生する例外
+    (Exception raised when loading a motion profile fails)"""
+
+    pass
+
+
+def _make_trap_eval(
+    Ta: float,
+    Tac: float,
+    T: float,
+    A: float,
+    V: float,
+    L: float,
+    C1: float,
+    C2: float,
+    d: float,
+) -> Callable[[float], tuple[float, float]]:
+    """定数を埋め込んだ台形モーションプロファイルの計算関数を生成する
+    (Creates a trapezoidal motion profile evaluator with its constants baked in)
+
+    移動方向を含めた定数をクロージャに保持するため、計算時に属性参照や
+    方向の乗算が発生しない。等速区間がない三角形の場合は、等速区間の判定を
+    省いた関数を返す。
+    (The constants, including the moving direction, are held in the closure,
+     so evaluation needs no attribute lookups or direction multiplies.
+     For the triangular case without a constant velocity phase,
+     a function without the constant velocity check is returned.)
+
+    Args:
+        Ta (float): [s] 加減速時間 (Acceleration / Deceleration time)
+        Tac (float): [s] 減速開始時間 Ta+Tc (Deceleration start time Ta+Tc)
+        T (float): [s] 移動時間 (Moving time)
+        A (float): [m/s^2] 加速度 (Acceleration)
+        V (float): [m/s] 最大速度 (Maximum velocity)
+        L (float): [m] 移動距離 (Moving length)
+        C1 (float): [m] 加速終了位置 (Position at the end of acceleration)
+        C2 (float): [m] 減速開始位置 (Position at the start of deceleration)
+        d (float): 移動方向 (Moving direction)
+
+    Returns:
+        Callable[[float], tuple[float, float]]: 時間 [s] から (速度 [m/s], 位置 [m])
+          を計算する関数 (Function from time to (velocity, position))
+    """
+    # 方向付きの定数 (signed constants)
+    dA = d * A
+    dhA = 0.5 * dA
+    dV = d * V
+    dVp = dA * Ta
+    dC1 = d * C1
+    dC2 = d * C2
+    dL = d * L
+
+    if Tac <= Ta:
+        # 三角形: 減速は到達速度 A*Ta から始まる
+        # (triangular: deceleration starts from the reached velocity A*Ta)
+        def _tri_eval(t: float) -> tuple[float, float]:
+            # 加速 (acceleration)
+            if t < Ta:
+                return dA * t, dhA * t * t
+            # 減速 (deceleration)
+            if t <= T:
+                td = t - Ta
+                return dA * (T - t), dC1 + dVp * td - dhA * td * td
+            # 停止 (stop)
+            return 0.0, dL
+
+        return _tri_eval
+
+    def _trap_eval(t: float) -> tuple[float, float]:
+        # 加速 (acceleration)
+        if t < Ta:
+            return dA * t, dhA * t * t
+        # 等速 (constant velocity)
+        if t < Tac:
+            return dVp, dC1 + dV * (t - Ta)
+        # 減速 (deceleration)
+        if t <= T:
+            td = t - Tac
+            return dA * (T - t), dC2 + dV * td - dhA * td * td
+        # 停止 (stop)
+        return 0.0, dL
+
+    return _trap_eval
+
+
 class MotionProfileLoader:
     """モーションプロファイル読込クラス (Loader for MotionProfile)"""
 
@@ -58,7 +145,7 @@ class MotionProfileLoader:
 
     def load(
         self, filepath="tkmotion/prof/default_motion_prof_config.json", prof_index=0
-    ) -> MotionProfile | None:
+    ) -> MotionProfile:
         """モーションプロファイル設定を読み込む (Load motion profile configuration)
 
         Args:
@@ -66,49 +153,48 @@ class MotionProfileLoader:
             prof_index (int): プロファイル設定辞書のインデックス (Index of the profile configuration dictionary)
 
         Returns:
-            MotionProfile | None: モーションプロファイル (MotionProfile)
+            MotionProfile: モーションプロファイル (MotionProfile)
+
+        Raises:
+            MotionProfileLoadError: 設定ファイルの読込、またはモーションプロファイルの作成に失敗した場合に発生
+              (If reading the configuration file or creating the motion profile fails)
         """
         try:
-            with open(filepath, "r") as f:
-                config = json.load(f)
-                # 設定バージョン互換性確認 (Check configuration version compatibility)
-                is_compatible = Utility.is_config_compatible(
-                    module_version, config[0]["motion_profile"][prof_index]["version"]
+            prof_config = Utility.load_json(filepath)[0]["motion_profile"][prof_index]
+            # 設定バージョン互換性確認 (Check configuration version compatibility)
+            is_compatible = Utility.is_config_compatible(
+                module_version, prof_config["version"]
+            )
+            if not is_compatible:
+                raise ConfigVersionIncompatibleError(
+                    f"Incompatible motion profile config version: "
+                    f"module_version={module_version}, "
+                    f"config_version={prof_config['version']}"
                 )
-                if not is_compatible:
-                    raise ConfigVersionIncompatibleError(
-                        f"Incompatible motion profile config version: "
-                        f"module_version={module_version}, "
-                        f"config_version={config[0]['motion_profile'][prof_index]['version']}"
-                    )
-                # モーションプロファイルオブジェクト作成 (Create motion profile object)
-                match config[0]["motion_profile"][prof_index]["type"]:
-                    case "trapezoid":
-                        return TrapezoidalMotionProfile(
-                            config[0]["motion_profile"][prof_index]
-                        )
-                    case "impulse":
-                        return ImpulseMotionProfile(
-                            config[0]["motion_profile"][prof_index]
-                        )
-                    case "step":
-                        return StepMotionProfile(
-                            config[0]["motion_profile"][prof_index]
-                        )
-                    case "sin":
-                        return SinusoidalMotionProfile(
-                            config[0]["motion_profile"][prof_index]
-                        )
-                    case _:
-                        return MotionProfile(config[0]["motion_profile"][prof_index])
-        except Exception as e:
-            print(f"Error loading motion profile: {type(e)} {e}")
-        return None
+            # モーションプロファイルオブジェクト作成 (Create motion profile object)
+            profile_cls = _PROFILE_TYPES.get(prof_config["type"], MotionProfile)
+            return profile_cls(prof_config)
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            IndexError,
+            TypeError,
+            ConfigVersionIncompatibleError,
+            VelocityZeroOrMinusError,
+            AccelerationZeroOrMinusError,
+            MovingLengthZeroError,
+        ) as e:
+            raise MotionProfileLoadError(
+                f"Error loading motion profile: {type(e)} {e}"
+            ) from e
 
 
 class MotionProfile:
     """モーションプロファイルの基底クラス (A base class for motion profiles)"""
 
+    __slots__ = ("_config", "_cmd_vel", "_cmd_pos")
+
     def __init__(self, config: dict):
         """モーションプロファイルを初期化する (Initializes the MotionProfile)."""
         self._config: dict = config
@@ -176,6 +262,11 @@ class MotionProfile:
         """
         return MotionProfileObserver(self)
 
+    def reset(self) -> None:
+        """モーションプロファイルの状態をリセットする (Reset the motion profile state)"""
+        self._cmd_vel = 0.0
+        self._cmd_pos = 0.0
+
     def calculate_cmd_vel_pos(self, t: float) -> tuple[float, float]:
         """指令速度と位置を計算する (Calculates command velocity and position)
 
@@ -187,6 +278,44 @@ class MotionProfile:
         # ベースクラスのデフォルト実装 (Default implementation for base class)
         return 0.0, 0.0
 
+    def calculate_cmd_vel_pos_array(
+        self, t: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """時間配列に対する指令速度と位置を計算する
+        (Calculates command velocity and position over a time array)
+
+        Args:
+            t (np.ndarray): [s] 時間配列 (Time array)
+        Returns:
+            tuple[np.ndarray, np.ndarray]: ([m/s], [m]) (速度配列、位置配列)
+            (velocity array, position array)
+        """
+        # ベースクラスのデフォルト実装: 時刻毎にスカラー計算を行う
+        # (Default implementation for base class: scalar calculation at each time)
+        t = np.asarray(t, dtype=np.float64)
+        vel = np.empty_like(t)
+        pos = np.empty_like(t)
+        for i, ti in enumerate(t.flat):
+            vel.flat[i], pos.flat[i] = self.calculate_cmd_vel_pos(float(ti))
+        return vel, pos
+
+    def _store_last_cmd(self, vel: np.ndarray, pos: np.ndarray) -> None:
+        """配列計算の最後の要素を現在の指令速度と位置として保持する
+        (Stores the last element of an array calculation as the current command
+         velocity and position)
+
+        スカラー計算を時刻順に呼んだ場合と同じく、cmd_velとcmd_posは最後の時刻の値となる。
+        (As with calling the scalar calculation in time order,
+         cmd_vel and cmd_pos hold the values at the last time.)
+
+        Args:
+            vel (np.ndarray): [m/s] 速度配列 (Velocity array)
+            pos (np.ndarray): [m] 位置配列 (Position array)
+        """
+        if vel.size:
+            self._cmd_vel = float(vel.flat[-1])
+            self._cmd_pos = float(pos.flat[-1])
+
 
 class MotionProfileObserver:
     """モーションプロファイルオブザーバー (Motion profile observer)"""
@@ -217,6 +346,17 @@ class MotionProfileObserver:
         self._cmd_vel_list.append(self._motion_profile.cmd_vel)
         self._cmd_pos_list.append(self._motion_profile.cmd_pos)
 
+    def observe_array(self, cmd_vel: np.ndarray, cmd_pos: np.ndarray) -> None:
+        """一括計算した指令速度と位置を観測データに追加する
+        (Adds command velocities and positions calculated at once to the observed data)
+
+        Args:
+            cmd_vel (np.ndarray): [m/s] 指令速度配列 (Command velocity array)
+            cmd_pos (np.ndarray): [m] 指令位置配列 (Command position array)
+        """
+        self._cmd_vel_list.extend(cmd_vel.tolist())
+        self._cmd_pos_list.extend(cmd_pos.tolist())
+
     def get_observed_data(self) -> dict:
         """観測データの辞書を返す (Returns a dictionary of observed data)"""
         return {
@@ -228,6 +368,30 @@ class MotionProfileObserver:
 class TrapezoidalMotionProfile(MotionProfile):
     """台形モーションプロファイル (Trapezoidal motion profile)"""
 
+    __slots__ = (
+        "V",
+        "A",
+        "L",
+        "dir",
+        "Ta",
+        "T",
+        "Tc",
+        "_Tac",
+        "_C1",
+        "_C2",
+        "_bp",
+        "_piece_table",
+        "_eval",
+        "_params",
+    )
+
+    # 必須設定キー (required configuration keys)
+    _REQUIRED_KEYS: tuple[str, ...] = (
+        "max_velocity_m_s",
+        "acceleration_m_s2",
+        "length_m",
+    )
+
     def __init__(self, config: dict):
         """TrapezoidalMotionProfileを初期化する (Initializes the TrapezoidalMotionProfile)
 
@@ -243,44 +407,26 @@ class TrapezoidalMotionProfile(MotionProfile):
         """
         super().__init__(config)
 
-        # 最大速度 (maximum velocity)
-        try:
-            _V: float = self._config["max_velocity_m_s"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'max_velocity_m_s' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
+        Utility.require_keys(self._config, self._REQUIRED_KEYS, "motion profile")
 
+        # 最大速度 (maximum velocity)
+        _V: float = float(self._config["max_velocity_m_s"])
         if _V <= 0.0:
             raise VelocityZeroOrMinusError("Velocity must be positive.")
         self.V: float = _V
 
         # 加速度 (acceleration)
-        try:
-            _A: float = self._config["acceleration_m_s2"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'acceleration_m_s2' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-
+        _A: float = float(self._config["acceleration_m_s2"])
         if _A <= 0.0:
             raise AccelerationZeroOrMinusError("Acceleration must be positive.")
         self.A: float = _A
 
         # 移動距離 (moving length)
-        try:
-            _L: float = self._config["length_m"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'length_m' in motion profile configuration: {type(e)} {e}"
-            )
-
+        _L: float = float(self._config["length_m"])
         if _L == 0.0:
             raise MovingLengthZeroError("Moving length must be non-zero.")
-        self.L: float = np.abs(_L)
-        self.dir: float = np.sign(_L)
+        self.L: float = abs(_L)
+        self.dir: float = 1.0 if _L > 0.0 else -1.0
 
         # 加減速時間 (Acceleration / Deceleration time)
         self.Ta: float = self.V / self.A
@@ -294,6 +440,101 @@ class TrapezoidalMotionProfile(MotionProfile):
             self.Tc = 0.0
             self.T = 2 * self.Ta
 
+        # 位相境界と位置の定数 (phase boundary and position constants)
+        # 減速開始時間 (deceleration start time)
+        self._Tac: float = self.Ta + self.Tc
+        # 加速終了位置 (position at the end of acceleration)
+        self._C1: float = 0.5 * self.A * self.Ta * self.Ta
+        # 減速開始位置 (position at the start of deceleration)
+        self._C2: float = self._C1 + self.V * self.Tc
+
+        # 配列計算用の区間境界と区間毎の係数表 (行: 加速, 等速, 減速, 停止)
+        # (phase breakpoints and per-phase coefficient table for array calculation,
+        #  rows: acceleration, constant velocity, deceleration, stop)
+        # 停止区間は t > T なので、Tの直後を境界とする
+        # (the stop phase is t > T, so its breakpoint is just after T)
+        self._bp: np.ndarray = np.array(
+            [self.Ta, self._Tac, np.nextafter(self.T, np.inf)], dtype=np.float64
+        )
+        # 列: 区間開始時間, 速度 v0 + v1*tau, 位置 p0 + p1*tau + p2*tau^2
+        # (columns: phase start time, velocity v0 + v1*tau,
+        #  position p0 + p1*tau + p2*tau^2)
+        piece_table = np.array(
+            [
+                [0.0, 0.0, self.A, 0.0, 0.0, 0.5 * self.A],
+                [self.Ta, self.A * self.Ta, 0.0, self._C1, self.V, 0.0],
+                [
+                    self._Tac,
+                    self.A * (self.T - self._Tac),
+                    -self.A,
+                    self._C2,
+                    self.V if self.Tc > 0.0 else self.A * self.Ta,
+                    -0.5 * self.A,
+                ],
+                [self.T, 0.0, 0.0, self.L, 0.0, 0.0],
+            ],
+            dtype=np.float64,
+        )
+        # 移動方向を係数に含め、列毎に連続した配列として保持する
+        # (fold the moving direction into the coefficients and keep each column
+        #  as a contiguous array)
+        piece_table[:, 1:] *= self.dir
+        self._piece_table: np.ndarray = np.ascontiguousarray(piece_table.T)
+
+        # 定数を埋め込んだ計算関数 (evaluator with the constants baked in)
+        self._eval: Callable[[float], tuple[float, float]] = _make_trap_eval(
+            self.Ta,
+            self._Tac,
+            self.T,
+            self.A,
+            self.V,
+            self.L,
+            self._C1,
+            self._C2,
+            self.dir,
+        )
+
+        # 外部の計算カーネルに渡す読み取り専用の連続パラメータ配列
+        # (read-only contiguous parameter array for external calculation kernels)
+        self._params: np.ndarray = np.ascontiguousarray(
+            [
+                self.V,
+                self.A,
+                self.L,
+                self.Ta,
+                self.Tc,
+                self.T,
+                self.dir,
+                self._C1,
+                self._C2,
+            ],
+            dtype=np.float64,
+        )
+        self._params.setflags(write=False)
+
+    @property
+    def params(self) -> np.ndarray:
+        """読み取り専用のパラメータ配列 (Read-only parameter array)
+
+        要素の並びは (V, A, L, Ta, Tc, T, dir, C1, C2) である。
+        (The elements are ordered as (V, A, L, Ta, Tc, T, dir, C1, C2).)
+        """
+        return self._params
+
+    def params_ptr(self) -> int:
+        """パラメータ配列の先頭アドレスを返す
+        (Returns the address of the first element of the parameter array)
+
+        C言語などの外部の計算カーネルに、コピーなしでパラメータを渡すために使用する。
+        アドレスは、このモーションプロファイルが生存している間のみ有効である。
+        (Used to hand the parameters to external kernels such as C code without copying.
+         The address is valid only while this motion profile is alive.)
+
+        Returns:
+            int: double[9]配列の先頭アドレス (Address of the double[9] array)
+        """
+        return self._params.ctypes.data
+
     def calculate_cmd_vel_pos(self, t: float) -> tuple[float, float]:
         """指令速度と位置を計算する (Calculates command velocity and position)
 
@@ -303,36 +544,96 @@ class TrapezoidalMotionProfile(MotionProfile):
         Returns:
             tuple[float, float]: ([m/s], [m]) (速度、位置) (velocity, position)
         """
-        # 加速 (acceleration)
-        if t < self.Ta:
-            vel = self.dir * self.A * t
-            pos = self.dir * (0.5 * self.A * t**2)
-        # 等速 (constant velocity)
-        elif t < (self.Ta + self.Tc):
-            vel = self.dir * self.A * self.Ta
-            pos = self.dir * (0.5 * self.A * self.Ta**2 + self.V * (t - self.Ta))
-        # 減速 (deceleration)
-        elif t <= self.T:
-            td = t - self.Ta - self.Tc
-            vel = self.dir * self.A * (self.T - t)
-            pos = self.dir * (
-                0.5 * self.A * self.Ta**2
-                + self.V * self.Tc
-                + self.V * td
-                - 0.5 * self.A * td**2
-            )
-        # 停止 (stop)
-        else:
-            vel = 0.0
-            pos = self.dir * self.L
-
-        self._cmd_vel, self._cmd_pos = vel, pos
+        self._cmd_vel, self._cmd_pos = self._eval(t)
         return self._cmd_vel, self._cmd_pos
 
+    def calculate_cmd_vel_pos_array(
+        self, t: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """時間配列に対する指令速度と位置を計算する
+        (Calculates command velocity and position over a time array)
+
+        Args:
+            t (np.ndarray): [s] 時間配列 (Time array)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: ([m/s], [m]) (速度配列、位置配列)
+            (velocity array, position array)
+        """
+        t = np.asarray(t, dtype=np.float64)
+
+        # 区間を二分探索し、区間毎の係数で計算する
+        # (binary-search the phase and evaluate with the per-phase coefficients)
+        # 列毎に係数を取り出し、一時配列を増やさないようにその場で計算する
+        # (gather the coefficients per column and evaluate in place
+        #  to avoid extra temporary arrays)
+        idx = np.searchsorted(self._bp, t, side="right")
+        t0, v0, v1, p0, p1, p2 = self._piece_table
+        tau = t - t0[idx]
+        vel = v1[idx]
+        vel *= tau
+        vel += v0[idx]
+        pos = p2[idx]
+        pos *= tau
+        pos += p1[idx]
+        pos *= tau
+        pos += p0[idx]
+
+        self._store_last_cmd(vel, pos)
+        return vel, pos
+
+    def sample(self, dt: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """時間間隔dtで軌道全体をサンプリングする
+        (Samples the whole trajectory at time interval dt)
+
+        時間配列は0から始まり、移動時間T以上となる最初の時刻で終わる。
+        (The time array starts at 0 and ends at the first time not less than the moving time T.)
+
+        Args:
+            dt (float): [s] サンプリング間隔 (Sampling interval)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: ([s], [m/s], [m])
+            (時間配列、速度配列、位置配列) (time array, velocity array, position array)
+
+        Raises:
+            ValueError: サンプリング間隔がゼロまたは負の値の場合に発生
+              (If the sampling interval is zero or negative)
+        """
+        if dt <= 0.0:
+            raise ValueError(f"Sampling interval must be positive: dt={dt}")
+        n = int(np.ceil(self.T / dt))
+        t = np.arange(n + 1, dtype=np.float64) * dt
+        vel, pos = self.calculate_cmd_vel_pos_array(t)
+        return t, vel, pos
+
+    def sample_n(self, n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """軌道全体を等間隔のn点でサンプリングする
+        (Samples the whole trajectory at n evenly spaced points)
+
+        Args:
+            n (int): サンプル数 (Number of samples)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: ([s], [m/s], [m])
+            (時間配列、速度配列、位置配列) (time array, velocity array, position array)
+        """
+        t = np.linspace(0.0, self.T, n)
+        vel, pos = self.calculate_cmd_vel_pos_array(t)
+        return t, vel, pos
+
 
 class ImpulseMotionProfile(MotionProfile):
     """インパルスモーションプロファイル (Impulse motion profile)"""
 
+    # 必須設定キー (required configuration keys)
+    _REQUIRED_KEYS: tuple[str, ...] = (
+        "impulse_vel_m_s",
+        "impulse_pos_m",
+        "impulse_on_timestep_count",
+        "delay_s",
+    )
+
     def __init__(self, config: dict):
         """ImpulseMotionProfileを初期化する (Initializes the ImpulseMotionProfile)
 
@@ -342,47 +643,27 @@ class ImpulseMotionProfile(MotionProfile):
         """
         super().__init__(config)
 
+        Utility.require_keys(self._config, self._REQUIRED_KEYS, "motion profile")
+
         # インパルス速度 (impulse velocity)
-        try:
-            _p_vel: float = self._config["impulse_vel_m_s"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'impulse_vel_m_s' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.p_vel: float = _p_vel
+        self.p_vel: float = self._config["impulse_vel_m_s"]
 
         # インパルス位置 (impulse position)
-        try:
-            _p_pos: float = self._config["impulse_pos_m"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'impulse_pos_m' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.p_pos: float = _p_pos
+        self.p_pos: float = self._config["impulse_pos_m"]
 
         # インパルスONタイムステップ数 (impulse on time step count)
-        try:
-            _on_timestep_count: int = self._config["impulse_on_timestep_count"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'impulse_on_timestep_count' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.on_timestep_count: int = _on_timestep_count
+        self.on_timestep_count: int = self._config["impulse_on_timestep_count"]
 
         # 遅延時間 (delay time)
-        try:
-            _delay_s: float = self._config["delay_s"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'delay_s' in motion profile " f"configuration: {type(e)} {e}"
-            )
-        self.delay_s: float = _delay_s
+        self.delay_s: float = self._config["delay_s"]
 
-        # 時間ステップカウンタ (time step counter)
-        self._step_counter: int = 0
+        # 残りのインパルスONタイムステップ数 (remaining impulse on time step count)
+        self._remaining_steps: int = self.on_timestep_count
+
+    def reset(self) -> None:
+        """モーションプロファイルの状態をリセットする (Reset the motion profile state)"""
+        super().reset()
+        self._remaining_steps = self.on_timestep_count
 
     def calculate_cmd_vel_pos(self, t: float) -> tuple[float, float]:
         """指令速度と位置を計算する (Calculates command velocity and position)
@@ -392,12 +673,10 @@ class ImpulseMotionProfile(MotionProfile):
         Returns:
             tuple[float, float]: ([m/s], [m]) (速度、位置) (velocity, position)
         """
-        # 遅延時間中はゼロを返す (return zero during delay time)
-        if t < self.delay_s:
-            vel, pos = 0.0, 0.0
-        # 指定時間ステップの間はインパルス値を返す (return impulse values for specified time steps)
-        elif self._step_counter < self.on_timestep_count:
-            self._step_counter += 1
+        # 遅延時間後、残りステップがある間はインパルス値を返す
+        # (return impulse values after the delay time while steps remain)
+        if self._remaining_steps > 0 and t >= self.delay_s:
+            self._remaining_steps -= 1
             vel, pos = self.p_vel, self.p_pos
         else:
             vel, pos = 0.0, 0.0
@@ -405,10 +684,50 @@ class ImpulseMotionProfile(MotionProfile):
         self._cmd_vel, self._cmd_pos = vel, pos
         return self._cmd_vel, self._cmd_pos
 
+    def calculate_cmd_vel_pos_array(
+        self, t: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """時間配列に対する指令速度と位置を計算する
+        (Calculates command velocity and position over a time array)
+
+        時刻を順に calculate_cmd_vel_pos に渡した場合と同じ結果となり、
+        残りステップ数も同様に消費される。
+        (Gives the same result as passing the times to calculate_cmd_vel_pos in order,
+         and consumes the remaining step count in the same way.)
+
+        Args:
+            t (np.ndarray): [s] 時間配列 (Time array)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: ([m/s], [m]) (速度配列、位置配列)
+            (velocity array, position array)
+        """
+        t = np.asarray(t, dtype=np.float64)
+        vel = np.zeros_like(t)
+        pos = np.zeros_like(t)
+
+        # 遅延時間後の最初の残りステップ数分の時刻にインパルス値を設定する
+        # (set the impulse values at the first remaining-step-count times after the delay)
+        if self._remaining_steps > 0:
+            on_idx = np.flatnonzero(t >= self.delay_s)[: self._remaining_steps]
+            vel.flat[on_idx] = self.p_vel
+            pos.flat[on_idx] = self.p_pos
+            self._remaining_steps -= on_idx.size
+
+        self._store_last_cmd(vel, pos)
+        return vel, pos
+
 
 class StepMotionProfile(MotionProfile):
     """ステップモーションプロファイル (Step motion profile)"""
 
+    # 必須設定キー (required configuration keys)
+    _REQUIRED_KEYS: tuple[str, ...] = (
+        "step_velocity_m_s",
+        "step_position_m",
+        "delay_s",
+    )
+
     def __init__(self, config: dict):
         """StepMotionProfileを初期化する (Initializes the StepMotionProfile)
 
@@ -418,34 +737,16 @@ class StepMotionProfile(MotionProfile):
         """
         super().__init__(config)
 
+        Utility.require_keys(self._config, self._REQUIRED_KEYS, "motion profile")
+
         # ステップ速度 (step velocity)
-        try:
-            _s_vel: float = self._config["step_velocity_m_s"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'step_velocity_m_s' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.s_vel: float = _s_vel
+        self.s_vel: float = self._config["step_velocity_m_s"]
 
         # ステップ位置 (step position)
-        try:
-            _s_pos: float = self._config["step_position_m"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'step_position_m' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.s_pos: float = _s_pos
+        self.s_pos: float = self._config["step_position_m"]
 
         # 遅延時間 (delay time)
-        try:
-            _delay_s: float = self._config["delay_s"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'delay_s' in motion profile " f"configuration: {type(e)} {e}"
-            )
-        self.delay_s: float = _delay_s
+        self.delay_s: float = self._config["delay_s"]
 
     def calculate_cmd_vel_pos(self, t: float) -> tuple[float, float]:
         """指令速度と位置を計算する (Calculates command velocity and position)
@@ -466,10 +767,39 @@ class StepMotionProfile(MotionProfile):
         self._cmd_vel, self._cmd_pos = vel, pos
         return self._cmd_vel, self._cmd_pos
 
+    def calculate_cmd_vel_pos_array(
+        self, t: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """時間配列に対する指令速度と位置を計算する
+        (Calculates command velocity and position over a time array)
+
+        Args:
+            t (np.ndarray): [s] 時間配列 (Time array)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: ([m/s], [m]) (速度配列、位置配列)
+            (velocity array, position array)
+        """
+        t = np.asarray(t, dtype=np.float64)
+
+        # 遅延時間中はゼロ、遅延時間後はステップ値 (zero during the delay, step values after it)
+        after_delay = t >= self.delay_s
+        vel = np.where(after_delay, self.s_vel, 0.0).astype(np.float64, copy=False)
+        pos = np.where(after_delay, self.s_pos, 0.0).astype(np.float64, copy=False)
+
+        self._store_last_cmd(vel, pos)
+        return vel, pos
+
 
 class SinusoidalMotionProfile(MotionProfile):
     """正弦波モーションプロファイル (Sinusoidal motion profile)"""
 
+    # 必須設定キー (required configuration keys)
+    _REQUIRED_KEYS: tuple[str, ...] = (
+        "amplitude_m",
+        "frequency_Hz",
+    )
+
     def __init__(self, config: dict):
         """SinusoidalMotionProfileを初期化する (Initializes the SinusoidalMotionProfile)
 
@@ -479,25 +809,19 @@ class SinusoidalMotionProfile(MotionProfile):
         """
         super().__init__(config)
 
+        Utility.require_keys(self._config, self._REQUIRED_KEYS, "motion profile")
+
         # 振幅 (amplitude)
-        try:
-            _amplitude: float = self._config["amplitude_m"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'amplitude_m' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.amplitude: float = _amplitude
+        self.amplitude: float = self._config["amplitude_m"]
 
         # 周波数 (frequency)
-        try:
-            _frequency: float = self._config["frequency_Hz"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing 'frequency_Hz' in motion profile "
-                f"configuration: {type(e)} {e}"
-            )
-        self.frequency: float = _frequency
+        self.frequency: float = self._config["frequency_Hz"]
+
+        # 計算用の定数 (constants for the calculation)
+        # 角周波数 ω = 2πf (angular frequency)
+        self._omega: float = 2 * math.pi * self.frequency
+        # 速度振幅 Aω (velocity amplitude)
+        self._vel_amp: float = self.amplitude * 2 * math.pi * self.frequency
 
     def calculate_cmd_vel_pos(self, t: float) -> tuple[float, float]:
         """指令速度と位置を計算する (Calculates command velocity and position)
@@ -507,14 +831,43 @@ class SinusoidalMotionProfile(MotionProfile):
             tuple[float, float]: ([m/s], [m]) (速度、位置) (velocity, position)
         """
         # 正弦波速度と位置計算 (sinusoidal velocity and position calculation)
-        vel = (
-            self.amplitude
-            * 2
-            * np.pi
-            * self.frequency
-            * np.cos(2 * np.pi * self.frequency * t)
-        )
-        pos = self.amplitude * np.sin(2 * np.pi * self.frequency * t)
+        # スカラ計算のためNumPyではなくmathを使用する
+        # (use math instead of NumPy for scalar calculation)
+        wt = self._omega * t
+        vel = self._vel_amp * math.cos(wt)
+        pos = self.amplitude * math.sin(wt)
 
         self._cmd_vel, self._cmd_pos = vel, pos
         return self._cmd_vel, self._cmd_pos
+
+    def calculate_cmd_vel_pos_array(
+        self, t: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """時間配列に対する指令速度と位置を計算する
+        (Calculates command velocity and position over a time array)
+
+        Args:
+            t (np.ndarray): [s] 時間配列 (Time array)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: ([m/s], [m]) (速度配列、位置配列)
+            (velocity array, position array)
+        """
+        t = np.asarray(t, dtype=np.float64)
+
+        # 正弦波速度と位置計算 (sinusoidal velocity and position calculation)
+        wt = self._omega * t
+        vel = self._vel_amp * np.cos(wt)
+        pos = self.amplitude * np.sin(wt)
+
+        self._store_last_cmd(vel, pos)
+        return vel, pos
+
+
+# プロファイル種別とクラスの対応表 (table mapping profile types to classes)
+_PROFILE_TYPES: dict[str, type[MotionProfile]] = {
+    "trapezoid": TrapezoidalMotionProfile,
+    "impulse": ImpulseMotionProfile,
+    "step": StepMotionProfile,
+    "sin": SinusoidalMotionProfile,
+}
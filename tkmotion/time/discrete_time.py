@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-import json
+import numpy as np
 
 from tkmotion.util.utility import Utility
 from tkmotion.util.utility import ConfigVersionIncompatibleError
@@ -50,19 +50,18 @@ class DiscreteTimeLoader:
             DiscreteTime | None: 離散時間オブジェクト (DiscreteTime object)
         """
         try:
-            with open(filepath, "r") as f:
-                config = json.load(f)
-                # 設定バージョン互換性確認 (Check configuration version compatibility)
-                is_compatible = Utility.is_config_compatible(
-                    module_version, config[0]["discrete_time"][dtime_index]["version"]
+            dtime_config = Utility.load_json(filepath)[0]["discrete_time"][dtime_index]
+            # 設定バージョン互換性確認 (Check configuration version compatibility)
+            is_compatible = Utility.is_config_compatible(
+                module_version, dtime_config["version"]
+            )
+            if not is_compatible:
+                raise ConfigVersionIncompatibleError(
+                    f"Incompatible discrete time config version: "
+                    f"module_version={module_version}, "
+                    f"config_version={dtime_config['version']}"
                 )
-                if not is_compatible:
-                    raise ConfigVersionIncompatibleError(
-                        f"Incompatible discrete time config version: "
-                        f"module_version={module_version}, "
-                        f"config_version={config[0]['discrete_time'][dtime_index]['version']}"
-                    )
-                return DiscreteTime(config[0]["discrete_time"][dtime_index])
+            return DiscreteTime(dtime_config)
         except Exception as e:
             print(f"Error loading discrete time configuration: {type(e)} {e}")
         return None
@@ -71,6 +70,8 @@ class DiscreteTimeLoader:
 class DiscreteTime:
     """離散時間クラス (Discrete Time Class)"""
 
+    __slots__ = ("_config", "_dt", "_duration_s")
+
     def __init__(self, config: dict):
         """離散時間設定を初期化する
         (Initialize DiscreteTime with given configuration)
@@ -156,10 +157,26 @@ class DiscreteTime:
         """設定辞書を返す (Return the configuration dictionary)"""
         return self._config
 
+    def get_time_array(self) -> np.ndarray:
+        """時間ステップの配列を返す (時間ステップを0からdurationまでdt刻みで生成する)
+        (Returns an array of time steps from 0 to duration with step dt.)
+
+        各時刻はdtの累積加算ではなく一括で計算されるため、丸め誤差が蓄積しない。
+        durationがdtの整数倍でない場合、最後の時刻はduration以下の最大のステップとなる。
+        (Each time is computed at once instead of by accumulating dt,
+         so rounding errors do not build up.
+         If duration is not a multiple of dt,
+         the last time is the largest step not exceeding duration.)
+
+        Returns:
+            np.ndarray: [s] 時間ステップ配列 (Array of time steps)
+        """
+        # 丸め誤差でdurationちょうどのステップを落とさないよう、わずかな許容値を加える
+        # (add a small tolerance so the step exactly at duration is not lost to rounding)
+        n = int(np.floor(self._duration_s / self._dt + 1e-9))
+        return np.arange(n + 1) * self._dt
+
     def get_time_step_generator(self):
         """時間ステップ生成器を返す (時間ステップを0からdurationまでdt刻みで生成する)
         (Generator that yields time steps from 0 to duration with step dt.)"""
-        t = 0.0
-        while t <= self._duration_s:
-            yield t
-            t += self._dt
+        yield from self.get_time_array().tolist()
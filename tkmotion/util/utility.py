@@ -12,10 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
+import re
+from functools import lru_cache
+
+# orjsonが利用可能であれば高速なJSON解析に使用する
+# (use orjson for faster JSON parsing if available)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
 # ユーティリティモジュールのバージョン情報
 # (utility module version information)
 module_version = "0.3.0"
 
+# バージョン文字列の形式 "major.minor.patch" (version string format)
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
 
 class ConfigVersionIncompatibleError(Exception):
     """設定バージョンが互換性のない場合に発生する例外
@@ -24,6 +42,41 @@ class ConfigVersionIncompatibleError(Exception):
     pass
 
 
+def _match_version(version: str) -> re.Match | None:
+    """バージョン文字列を "major.minor.patch" 形式と照合する
+    (Matches a version string against the "major.minor.patch" format)
+
+    Args:
+        version (str): バージョン文字列 (Version string)
+
+    Returns:
+        re.Match | None: 形式が正しい場合は照合結果、それ以外はNone
+          (Match object if the format is valid, None otherwise)
+    """
+    if not isinstance(version, str):
+        return None
+    return _VERSION_RE.fullmatch(version)
+
+
+@lru_cache(maxsize=32)
+def _read_file_cached(abspath: str, mtime_ns: int) -> bytes:
+    """ファイルの内容を読み込み、キャッシュする
+    (Reads the contents of a file and caches them)
+
+    キャッシュするのは変更できないバイト列のみで、解析は呼び出し側で毎回行う。
+    (Only the immutable bytes are cached; the caller parses them on every call.)
+
+    Args:
+        abspath (str): ファイルの絶対パス (Absolute path to the file)
+        mtime_ns (int): [ns] ファイルの更新時刻 (Modification time of the file)
+
+    Returns:
+        bytes: ファイルの内容 (Contents of the file)
+    """
+    with open(abspath, "rb") as f:
+        return f.read()
+
+
 class Utility:
     """ユーティリティクラス (Utility class)"""
 
@@ -33,10 +86,57 @@ class Utility:
         return module_version
 
     @staticmethod
+    def load_json(filepath: str) -> list:
+        """設定JSONファイルを読み込む (Loads a configuration JSON file)
+
+        ファイルの内容は (絶対パス, 更新時刻) をキーとしてキャッシュされ、
+        ファイルが更新されると再読込される。解析は呼び出し毎に行うため、
+        返される設定は呼び出し側が自由に変更してよい。
+        (The file contents are cached keyed on (absolute path, modification time),
+         and the file is re-read when it is updated. Parsing is done on every call,
+         so the caller owns the returned configuration and may modify it.)
+
+        Args:
+            filepath (str): JSONファイルのパス (Path to the JSON file)
+
+        Returns:
+            list: 設定リスト (Configuration list)
+
+        Raises:
+            OSError: ファイルが読み込めない場合 (If the file cannot be read)
+            ValueError: JSONの形式が不正な場合 (If the JSON is malformed)
+        """
+        return _json_loads(
+            _read_file_cached(os.path.abspath(filepath), os.stat(filepath).st_mtime_ns)
+        )
+
+    @staticmethod
+    def require_keys(config: dict, keys: tuple[str, ...], what: str) -> None:
+        """設定辞書に必須キーがすべて存在することを確認する
+        (Checks that all required keys exist in a configuration dictionary)
+
+        Args:
+            config (dict): 設定辞書 (Configuration dictionary)
+            keys (tuple[str, ...]): 必須キー (Required keys)
+            what (str): エラーメッセージに使う設定の名前 (Name of the configuration used in the error message)
+
+        Raises:
+            KeyError: 必須キーが存在しない場合に、不足しているキーをすべて示して発生
+              (If required keys are missing, listing all of the missing keys)
+        """
+        missing = [k for k in keys if k not in config]
+        if missing:
+            raise KeyError(f"Missing {missing} in {what} configuration")
+
+    @staticmethod
+    @lru_cache(maxsize=32)
     def is_config_compatible(module_version: str, config_version: str) -> bool:
         """モジュールバージョンと設定バージョンの互換性をチェックする
         (Checks compatibility between module version and configuration version)
 
+        結果はバージョン文字列の組み合わせ毎にキャッシュされる。
+        (The result is cached for each combination of version strings.)
+
         Args:
             module_version (str): モジュールのバージョン文字列 (Module version string)
             config_version (str): 設定のバージョン文字列 (Configuration version string)
@@ -47,19 +147,19 @@ class Utility:
         Raises:
             ValueError: バージョン文字列の形式が不正な場合 (If the version string format is invalid)
         """
-        try:
-            module_major, module_minor, module_patch = [
-                int(x) for x in module_version.split(".")
-            ]
-            config_major, config_minor, config_patch = [
-                int(x) for x in config_version.split(".")
-            ]
-            # メジャーバージョン番号が異なる場合、互換性がない
-            # (if major version numbers differ, not compatible)
-            return module_major == config_major
-        except Exception as e:
-            message = (
+        # 例外に頼らず、形式を明示的に確認する
+        # (validate the format explicitly instead of relying on exceptions)
+        module_match = _match_version(module_version)
+        # 同一のバージョン文字列であれば、設定側を解析せずに互換性ありとする
+        # (identical version strings are compatible without matching the config side)
+        if module_match is not None and config_version == module_version:
+            return True
+        config_match = _match_version(config_version)
+        if module_match is None or config_match is None:
+            raise ValueError(
                 f"Invalid version format: module_version={module_version}"
                 f", config_version={config_version}"
             )
-            raise ValueError(message) from e
+        # メジャーバージョン番号が異なる場合、互換性がない
+        # (if major version numbers differ, not compatible)
+        return int(module_match[1]) == int(config_match[1])